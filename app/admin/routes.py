@@ -17,6 +17,7 @@ from flask_login import login_required, current_user
 from werkzeug.utils import secure_filename
 from PIL import Image
 from app import db
+from config.config import ALLOWED_EXTENSIONS
 from app.models.product import Product, Category
 from app.models.order import Order, OrderStatus
 from app.models.user import User
@@ -290,8 +291,12 @@ def save_product_image(image_file):
     if not image_file:
         return None
     
+    extension = image_file.filename.rpartition('.')[2].lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        raise ValueError(f'Unsupported image type: {extension}')
+    
     # Generate unique filename
-    filename = str(uuid.uuid4()) + '.' + image_file.filename.rsplit('.', 1)[1].lower()
+    filename = str(uuid.uuid4()) + '.' + extension
     
     # Ensure upload directory exists
     upload_path = os.path.join(current_app.root_path, current_app.config['UPLOAD_FOLDER'])
@@ -269,6 +269,7 @@ def merge_guest_cart_with_user_cart(user):
         
         # Clear guest session
         session.pop('cart_session_id', None)
+        session.pop('cart_id', None)
         
         if merged_items > 0:
             current_app.logger.info(f'Merged {merged_items} items from guest cart to user cart for: {user.username}')
@@ -15,6 +15,14 @@ from flask_sqlalchemy import SQLAlchemy
 from app import db
 
 
+# Dialect-specific predicate for partial indexes over active products only;
+# each form matches how that dialect renders filter_by(is_active=True)
+_ACTIVE_ONLY = {
+    'postgresql_where': db.text('is_active'),
+    'sqlite_where': db.text('is_active = 1'),
+}
+
+
 class Category(db.Model):
     """Category model for product organization."""
     
@@ -152,6 +160,15 @@ class Product(db.Model):
     # Relationships
     cart_items = db.relationship('CartItem', backref='product', lazy='dynamic')
     order_items = db.relationship('OrderItem', backref='product', lazy='dynamic')
+
+    # Partial indexes covering only active products, matching the shop's
+    # is_active filter combined with each listing sort/filter column
+    __table_args__ = (
+        db.Index('ix_products_active_name', 'name', **_ACTIVE_ONLY),
+        db.Index('ix_products_active_created', db.desc('created_at'), **_ACTIVE_ONLY),
+        db.Index('ix_products_active_price', 'price', **_ACTIVE_ONLY),
+        db.Index('ix_products_active_category', 'category_id', **_ACTIVE_ONLY),
+    )
     
     def __init__(self, name, price, category_id, **kwargs):
         """Initialize product with required fields."""
@@ -263,6 +280,35 @@ class Product(db.Model):
             query = query.limit(limit)
         return query.all()
     
+    @classmethod
+    def get_featured_and_latest(cls, limit=8):
+        """
+        Get featured and latest active products in a single query.
+        
+        Both lists are selected as one UNION ALL with a discriminator column,
+        saving a database round-trip over querying them separately.
+        
+        Returns:
+            tuple: (featured products, latest products)
+        """
+        featured = db.select(cls.id, db.literal('featured').label('kind')).where(
+            cls.is_featured == True, cls.is_active == True
+        ).limit(limit)
+        latest = db.select(cls.id, db.literal('latest').label('kind')).where(
+            cls.is_active == True
+        ).order_by(cls.created_at.desc()).limit(limit)
+        
+        product_ids = db.union_all(featured.subquery().select(), latest.subquery().select()).subquery()
+        rows = db.session.execute(
+            db.select(cls, product_ids.c.kind)
+            .join(product_ids, cls.id == product_ids.c.id)
+            .order_by(cls.created_at.desc())
+        ).all()
+        
+        featured_products = [product for product, kind in rows if kind == 'featured']
+        latest_products = [product for product, kind in rows if kind == 'latest']
+        return featured_products, latest_products
+    
     @classmethod
     def get_by_category(cls, category_id, limit=None):
         """Get products by category."""
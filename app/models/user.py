@@ -10,12 +10,30 @@ Quality Management Principles:
 """
 
 from datetime import datetime
+from functools import cached_property
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm.attributes import set_committed_value
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
 
 
+# Columns the full name and profile-completeness values derive from
+PROFILE_FIELDS = (
+    'first_name', 'last_name', 'phone',
+    'address_line1', 'city', 'state', 'postal_code'
+)
+
+# Dialect INSERT constructs supporting ON CONFLICT DO NOTHING ... RETURNING
+_CONFLICT_INSERTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
+
 class User(UserMixin, db.Model):
     """
     User model for authentication and profile management.
@@ -56,6 +74,16 @@ class User(UserMixin, db.Model):
     postal_code = db.Column(db.String(20), nullable=True)
     country = db.Column(db.String(50), nullable=True, default='United States')
     
+    # Profile completeness, evaluated by the database as part of the user
+    # SELECT so reads need no Python field scan and admin queries can filter on it.
+    # TRIM() only strips spaces; has_complete_profile() matches that in Python
+    profile_complete = db.column_property(
+        db.and_(*(
+            db.and_(column.isnot(None), db.func.trim(column) != '')
+            for column in (first_name, last_name, phone, address_line1, city, state, postal_code)
+        ))
+    )
+    
     # Account Status
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
@@ -87,9 +115,14 @@ class User(UserMixin, db.Model):
         """Check if provided password matches stored hash."""
         return check_password_hash(self.password_hash, password)
     
+    @cached_property
+    def full_name(self):
+        """User's full name, cached until a name field changes."""
+        return f"{self.first_name} {self.last_name}"
+    
     def get_full_name(self):
         """Get user's full name."""
-        return f"{self.first_name} {self.last_name}"
+        return self.full_name
     
     def get_address(self):
         """Get formatted address string."""
@@ -103,11 +136,12 @@ class User(UserMixin, db.Model):
     
     def has_complete_profile(self):
         """Check if user has completed their profile."""
-        required_fields = [
-            self.first_name, self.last_name, self.phone,
-            self.address_line1, self.city, self.state, self.postal_code
-        ]
-        return all(field is not None and field.strip() for field in required_fields)
+        # The database-computed value is used once loaded; new users and
+        # users with unsaved profile edits are checked in Python
+        if self.__dict__.get('profile_complete') is not None:
+            return bool(self.profile_complete)
+        required_fields = [getattr(self, field) for field in PROFILE_FIELDS]
+        return all(field is not None and field.strip(' ') for field in required_fields)
     
     def update_last_login(self):
         """Update last login timestamp."""
@@ -158,7 +192,45 @@ class User(UserMixin, db.Model):
     # Class methods for user management
     @classmethod
     def create_user(cls, username, email, password, first_name, last_name, **kwargs):
-        """Create a new user with validation."""
+        """
+        Create a new user with validation.
+        
+        Extra keyword arguments must name User columns; anything else raises
+        TypeError. The password is hashed before the uniqueness check, so a
+        duplicate registration still pays for one hash.
+        """
+        unknown = set(kwargs) - set(cls.__table__.c.keys())
+        if unknown:
+            raise TypeError(f"Unknown user fields: {', '.join(sorted(unknown))}")
+        
+        insert = _CONFLICT_INSERTS.get(db.engine.dialect.name)
+        if insert is None:
+            return cls._create_user_checked(username, email, password, first_name, last_name, **kwargs)
+        
+        # Single INSERT ... ON CONFLICT DO NOTHING RETURNING: the database
+        # resolves username/email uniqueness atomically in one round-trip
+        stmt = insert(cls).values(
+            username=username,
+            email=email,
+            password_hash=generate_password_hash(password),
+            first_name=first_name,
+            last_name=last_name,
+            **kwargs
+        ).on_conflict_do_nothing().returning(cls)
+        user = db.session.scalars(stmt).first()
+        
+        if user is None:
+            # Conflict path only: find out which field already exists
+            if cls.query.filter_by(username=username).first():
+                raise ValueError(f"Username '{username}' already exists")
+            raise ValueError(f"Email '{email}' already exists")
+        
+        db.session.commit()
+        return user
+    
+    @classmethod
+    def _create_user_checked(cls, username, email, password, first_name, last_name, **kwargs):
+        """Create a new user with explicit existence checks (no ON CONFLICT support)."""
         # Check if username or email already exists
         if cls.query.filter_by(username=username).first():
             raise ValueError(f"Username '{username}' already exists")
@@ -186,4 +258,26 @@ class User(UserMixin, db.Model):
             user.update_last_login()
             return user
         
-        return None
\ No newline at end of file
+        return None
+
+
+def _clear_cached_full_name(target, *args):
+    """Drop the cached full name when the instance is refreshed or expired."""
+    target.__dict__.pop('full_name', None)
+
+
+def _clear_derived_profile(target, *args):
+    """Drop derived profile values when one of their source columns is assigned."""
+    target.__dict__.pop('full_name', None)
+    # The loaded profile_complete value is stale until the row is reloaded
+    state = inspect(target)
+    if state.session is not None and state.persistent:
+        state.session.expire(target, ['profile_complete'])
+    else:
+        set_committed_value(target, 'profile_complete', None)
+
+
+for _field in PROFILE_FIELDS:
+    event.listen(getattr(User, _field), 'set', _clear_derived_profile)
+event.listen(User, 'refresh', _clear_cached_full_name)
+event.listen(User, 'expire', _clear_cached_full_name)
@@ -10,33 +10,46 @@ Quality Management Principles:
 - User Experience: Clear navigation and feedback
 """
 
+import base64
+import json
 import uuid
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.orm import selectinload
 from flask import render_template, redirect, url_for, flash, request, session, jsonify, current_app
 from flask_login import current_user, login_required
 from app import db
+from config.config import POSTS_PER_PAGE
 from app.models.product import Product, Category
 from app.models.cart import Cart, CartItem
-from app.models.order import Order
+from app.models.order import Order, OrderItem
 from app.models.user import User
 from . import shop_bp
 from .forms import AddToCartForm, UpdateCartForm, CheckoutForm, SearchForm
 
 
+# Product listing sort options: sort column and whether it is descending.
+# Product.id is appended as a tiebreaker so keyset pagination is stable.
+PRODUCT_SORTS = {
+    'name_asc': (Product.name, False),
+    'name_desc': (Product.name, True),
+    'price_asc': (Product.price, False),
+    'price_desc': (Product.price, True),
+    'newest': (Product.created_at, True),
+    'oldest': (Product.created_at, False),
+}
+
+
 @shop_bp.route('/')
 def index():
     """Shop homepage with featured products and categories."""
     try:
-        # Get featured products
-        featured_products = Product.get_featured(limit=8)
+        # Get featured and latest products in one round-trip
+        featured_products, latest_products = Product.get_featured_and_latest(limit=8)
         
         # Get all active categories
         categories = Category.query.filter_by(is_active=True).order_by(Category.name).all()
         
-        # Get latest products
-        latest_products = Product.query.filter_by(is_active=True).order_by(
-            Product.created_at.desc()
-        ).limit(8).all()
-        
         return render_template(
             'shop/index.html',
             featured_products=featured_products,
@@ -53,10 +66,12 @@ def index():
 @shop_bp.route('/products')
 def products():
     """Product listing with search and filtering."""
-    page = request.args.get('page', 1, type=int)
+    cursor = request.args.get('cursor', '', type=str)
     search_query = request.args.get('q', '', type=str)
     category_id = request.args.get('category', 0, type=int)
     sort_by = request.args.get('sort', 'name_asc', type=str)
+    if sort_by not in PRODUCT_SORTS:
+        sort_by = 'name_asc'
     
     # Build base query
     query = Product.query.filter_by(is_active=True)
@@ -76,26 +91,16 @@ def products():
     if category_id:
         query = query.filter_by(category_id=category_id)
     
-    # Apply sorting
-    if sort_by == 'name_desc':
-        query = query.order_by(Product.name.desc())
-    elif sort_by == 'price_asc':
-        query = query.order_by(Product.price.asc())
-    elif sort_by == 'price_desc':
-        query = query.order_by(Product.price.desc())
-    elif sort_by == 'newest':
-        query = query.order_by(Product.created_at.desc())
-    elif sort_by == 'oldest':
-        query = query.order_by(Product.created_at.asc())
-    else:  # name_asc
-        query = query.order_by(Product.name.asc())
-    
-    # Paginate results
-    products = query.paginate(
-        page=page, 
-        per_page=12, 
-        error_out=False
-    )
+    # Keyset pagination: seek past the last row of the previous page
+    # instead of OFFSET, so every page costs the same regardless of depth
+    products = paginate_products(query, sort_by, cursor, per_page=POSTS_PER_PAGE)
+    
+    # Catalog size estimate is only meaningful for the unfiltered listing
+    if not search_query and not category_id:
+        products.total = approximate_product_count()
+    
+    # Search results are a small filtered set, so they keep an exact count
+    search_total = query.count() if search_query else None
     
     # Get categories for filter
     categories = Category.query.filter_by(is_active=True).order_by(Category.name).all()
@@ -112,6 +117,7 @@ def products():
         categories=categories,
         search_form=search_form,
         search_query=search_query,
+        search_total=search_total,
         category_id=category_id,
         sort_by=sort_by,
         title='Products'
@@ -389,7 +395,13 @@ def checkout():
 @login_required
 def order_confirmation(order_id):
     """Order confirmation page."""
-    order = Order.query.filter_by(id=order_id, user_id=current_user.id).first_or_404()
+    # Load items and only the product columns the template displays up front,
+    # instead of lazy-loading each item's product while rendering
+    order = Order.query.options(
+        selectinload(Order.items).selectinload(OrderItem.product).load_only(
+            Product.id, Product.name, Product.sku, Product.image_filename
+        )
+    ).filter_by(id=order_id, user_id=current_user.id).first_or_404()
     
     return render_template(
         'shop/order_confirmation.html',
@@ -398,6 +410,81 @@ def order_confirmation(order_id):
     )
 
 
+class ProductPage:
+    """One page of a keyset-paginated product listing."""
+    
+    def __init__(self, items, per_page, has_prev, next_cursor):
+        self.items = items
+        self.per_page = per_page
+        self.has_prev = has_prev
+        self.next_cursor = next_cursor
+        self.has_next = next_cursor is not None
+        self.total = None  # Approximate catalog size, when known
+
+
+def encode_product_cursor(sort_by, product):
+    """Encode the sort key and id of the last product on a page as an opaque cursor."""
+    column = PRODUCT_SORTS[sort_by][0]
+    value = getattr(product, column.key)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    payload = json.dumps([sort_by, value, product.id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_product_cursor(sort_by, cursor):
+    """Decode a cursor into (sort value, product id), or None if it is invalid."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, value, product_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort_by or not isinstance(product_id, int):
+            return None
+        column = PRODUCT_SORTS[sort_by][0]
+        if isinstance(column.type, db.DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(column.type, db.Numeric):
+            value = Decimal(value)
+        elif not isinstance(value, str):
+            return None
+        return value, product_id
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+
+def paginate_products(query, sort_by, cursor, per_page):
+    """Return the page of products following the cursor for the given sort."""
+    column, descending = PRODUCT_SORTS[sort_by]
+    
+    position = decode_product_cursor(sort_by, cursor) if cursor else None
+    if position:
+        key = db.tuple_(column, Product.id)
+        query = query.filter(key < position if descending else key > position)
+    
+    if descending:
+        query = query.order_by(column.desc(), Product.id.desc())
+    else:
+        query = query.order_by(column.asc(), Product.id.asc())
+    
+    # Fetch one extra row to learn whether a next page exists without a COUNT(*)
+    rows = query.limit(per_page + 1).all()
+    items = rows[:per_page]
+    next_cursor = encode_product_cursor(sort_by, items[-1]) if len(rows) > per_page else None
+    
+    return ProductPage(items, per_page, position is not None, next_cursor)
+
+
+def approximate_product_count():
+    """Get the planner's row estimate for products (PostgreSQL only), for display."""
+    if db.engine.dialect.name != 'postgresql':
+        return None
+    count = db.session.execute(
+        db.text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'products'")
+    ).scalar()
+    return count if count and count > 0 else None
+
+
 def get_or_create_cart():
     """Get or create cart for current user or session."""
     if current_user.is_authenticated:
@@ -415,10 +502,16 @@ def get_or_create_cart():
             session_id = str(uuid.uuid4())
             session['cart_session_id'] = session_id
         
-        cart = Cart.query.filter_by(session_id=session_id).first()
-        if not cart:
-            cart = Cart(session_id=session_id)
-            db.session.add(cart)
-            db.session.commit()
+        # Primary-key lookup of the cart remembered in the signed session;
+        # session_id stays authoritative if the stored id is missing or stale
+        cart_id = session.get('cart_id')
+        cart = db.session.get(Cart, cart_id) if cart_id else None
+        if cart is None or cart.session_id != session_id:
+            cart = Cart.query.filter_by(session_id=session_id).first()
+            if not cart:
+                cart = Cart(session_id=session_id)
+                db.session.add(cart)
+                db.session.commit()
+            session['cart_id'] = cart.id
         
         return cart
\ No newline at end of file
@@ -14,11 +14,42 @@ Quality Management:
 """
 
 import os
+from types import MappingProxyType
+from typing import Final
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
-# Load environment variables from .env file
+
+# Load environment variables from .env file (production gets its environment
+# from the process manager, so the file is not consulted there)
 basedir = os.path.abspath(os.path.dirname(__file__))
-load_dotenv(os.path.join(basedir, '.env'))
+_env_file = os.path.join(basedir, '.env')
+if os.environ.get('FLASK_ENV', 'development') != 'production':
+    load_dotenv(_env_file)
+
+# Settings read on hot request paths, resolved once at import so consumers can
+# import the constants directly instead of going through app.config
+POSTS_PER_PAGE: Final[int] = int(os.environ.get('POSTS_PER_PAGE', 12))
+ORDERS_PER_PAGE: Final[int] = int(os.environ.get('ORDERS_PER_PAGE', 10))
+MAIL_USE_TLS: Final[bool] = os.environ.get('MAIL_USE_TLS', 'true').lower() in ('true', 'on', '1')
+ALLOWED_EXTENSIONS: Final[frozenset] = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+
+
+def _engine_options(database_uri):
+    """
+    Build the SQLAlchemy engine options for a database URI.
+    
+    Pool sizing only applies to database servers; SQLite's pools (and the
+    in-memory one in particular) reject pool_size and max_overflow.
+    """
+    options = {
+        'pool_pre_ping': True,  # Drop stale connections before use
+        'pool_recycle': 3600,
+    }
+    if not database_uri.startswith('sqlite'):
+        options['pool_size'] = int(os.environ.get('DB_POOL_SIZE', 10))
+        options['max_overflow'] = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    return options
 
 
 class Config:
@@ -31,21 +62,22 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///' + os.path.join(os.path.dirname(basedir), 'instance', 'ecommerce.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_RECORD_QUERIES = True
+    SQLALCHEMY_RECORD_QUERIES = False
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     
     # Upload Configuration
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER') or 'app/static/uploads'
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16777216))  # 16MB
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+    ALLOWED_EXTENSIONS = ALLOWED_EXTENSIONS
     
     # Pagination Configuration
-    POSTS_PER_PAGE = int(os.environ.get('POSTS_PER_PAGE', 12))
-    ORDERS_PER_PAGE = int(os.environ.get('ORDERS_PER_PAGE', 10))
+    POSTS_PER_PAGE = POSTS_PER_PAGE
+    ORDERS_PER_PAGE = ORDERS_PER_PAGE
     
     # Mail Configuration
     MAIL_SERVER = os.environ.get('MAIL_SERVER')
     MAIL_PORT = int(os.environ.get('MAIL_PORT') or 587)
-    MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', 'true').lower() in ['true', 'on', '1']
+    MAIL_USE_TLS = MAIL_USE_TLS
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
     
@@ -69,7 +101,9 @@ class DevelopmentConfig(Config):
     DEBUG = True
     TESTING = False
     WTF_CSRF_ENABLED = True
-    SQLALCHEMY_ECHO = True  # Log SQL queries for debugging
+    # Log SQL queries for debugging only when explicitly requested
+    SQLALCHEMY_ECHO = os.environ.get('SQL_ECHO', 'false').lower() in ('true', 'on', '1')
+    SQLALCHEMY_RECORD_QUERIES = True
 
 
 class TestingConfig(Config):
@@ -78,8 +112,15 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     WTF_CSRF_ENABLED = False
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # In-memory database for tests
+    # Named shared-cache in-memory database, held on one connection so the
+    # schema is created once and every session sees the same tables
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///file:ecom_test?mode=memory&cache=shared&uri=true'
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False},
+    }
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_RECORD_QUERIES = True
     SECRET_KEY = 'testing-secret-key'
     
     # Selenium Configuration for UI Tests
@@ -109,16 +150,15 @@ class ProductionConfig(Config):
         
         # Log to stderr in production
         import logging
-        from logging import StreamHandler
-        file_handler = StreamHandler()
+        file_handler = logging.StreamHandler()
         file_handler.setLevel(logging.INFO)
         app.logger.addHandler(file_handler)
 
 
-# Configuration dictionary for easy access
-config = {
+# Configuration mapping for easy access (read-only view)
+config = MappingProxyType({
     'development': DevelopmentConfig,
     'testing': TestingConfig,
     'production': ProductionConfig,
     'default': DevelopmentConfig
-}
\ No newline at end of file
+})
\ No newline at end of file
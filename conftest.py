@@ -5,14 +5,21 @@ Provides shared fixtures and test configuration.
 
 import pytest
 import os
+import re
+import socket
 import sys
-from datetime import datetime
+import time
+import uuid
+from urllib.parse import urlparse
 
 # Add app to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tests.selenium.test_fixtures import TestConfig, TestData, TestUtils
 
+# Test names containing any of these keywords are marked as smoke tests
+_is_smoke_test = re.compile(r'login|cart|checkout|home').search
+
 
 def pytest_configure(config):
     """Configure pytest for Selenium tests."""
@@ -27,14 +34,16 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers."""
+    selenium_mark = pytest.mark.selenium
+    smoke_mark = pytest.mark.smoke
     for item in items:
         # Add selenium marker to all tests in selenium directory
         if "selenium" in str(item.fspath):
-            item.add_marker(pytest.mark.selenium)
+            item.add_marker(selenium_mark)
         
         # Add smoke marker to critical tests
-        if any(keyword in item.name for keyword in ["login", "cart", "checkout", "home"]):
-            item.add_marker(pytest.mark.smoke)
+        if _is_smoke_test(item.name):
+            item.add_marker(smoke_mark)
 
 
 @pytest.fixture(scope="session")
@@ -49,7 +58,7 @@ def test_data():
     return TestData
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_utils():
     """Provide test utilities."""
     return TestUtils
@@ -58,50 +67,45 @@ def test_utils():
 @pytest.fixture(scope="function")
 def unique_user_data():
     """Generate unique user data for testing."""
+    # One random draw split into two slices keeps username and email unique
+    unique = uuid.uuid4().hex
     return {
-        'username': TestUtils.generate_unique_username(),
-        'email': TestUtils.generate_unique_email(),
+        'username': f"testuser_{unique[:12]}",
+        'email': f"test_{unique[12:24]}@example.com",
         'first_name': 'Test',
         'last_name': 'User',
         'password': 'testpass123'
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def shipping_info():
-    """Provide shipping information for checkout tests."""
+    """Provide shipping information for checkout tests (shared; do not mutate)."""
     return TestData.SHIPPING_INFO.copy()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def cart_test_data():
-    """Provide cart test scenarios."""
+    """Provide cart test scenarios (shared; do not mutate)."""
     return TestData.CART_SCENARIOS.copy()
 
 
-@pytest.fixture(autouse=True)
-def test_environment_setup():
-    """Setup test environment before each test."""
-    # Ensure Flask app is running
-    yield
-    # Cleanup after test if needed
-
-
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results for reporting."""
-    if call.when == "call":
-        # Take screenshot on failure for Selenium tests
-        if hasattr(item, "funcargs") and "selenium" in item.keywords:
-            if call.excinfo is not None:  # Test failed
-                driver = None
-                # Try to get driver from test instance
-                if hasattr(item.instance, 'driver'):
-                    driver = item.instance.driver
-                
-                if driver:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_name = f"failed_{item.name}_{timestamp}.png"
-                    TestUtils.take_screenshot(driver, screenshot_name)
+    outcome = yield
+    
+    # Only failed Selenium test calls need a screenshot
+    if call.when != "call" or "selenium" not in item.keywords:
+        return
+    if not outcome.get_result().failed:
+        return
+    
+    # Try to get driver from test instance
+    driver = getattr(item.instance, 'driver', None)
+    if driver:
+        screenshot_name = "failed_%s_%s.png" % (item.name, time.strftime("%Y%m%d_%H%M%S"))
+        TestUtils.take_screenshot(driver, screenshot_name)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -111,15 +115,13 @@ def setup_test_environment():
     print("SETTING UP E-COMMERCE TEST ENVIRONMENT")
     print("="*60)
     
-    # Verify Flask app is accessible
-    import requests
+    # Verify Flask app is accessible (a TCP connect is enough for liveness)
+    url = urlparse(TestConfig.BASE_URL)
+    port = url.port or (443 if url.scheme == 'https' else 80)
     try:
-        response = requests.get(TestConfig.BASE_URL, timeout=5)
-        if response.status_code == 200:
+        with socket.create_connection((url.hostname, port), timeout=2):
             print(f"✓ Flask app is running at {TestConfig.BASE_URL}")
-        else:
-            print(f"⚠ Flask app returned status code: {response.status_code}")
-    except requests.exceptions.RequestException as e:
+    except OSError as e:
         print(f"✗ Flask app is not accessible: {e}")
         print("Please ensure the Flask app is running with: python run.py")
         pytest.exit("Flask app is not running", returncode=1)
@@ -4,235 +4,281 @@ Sample Data Generator for E-commerce Application.
 Creates sample categories and products for demonstration and testing.
 """
 
-from app import create_app, db
-from app.models.product import Product, Category
-from app.models.user import User
+import sys
+
+# Seed data as (column tuple, rows) pairs; rows are zipped into dicts on use
+_CATEGORY_COLS = ('name', 'description')
+_CATEGORIES = (
+    ('Electronics', 'Latest electronic devices and gadgets'),
+    ('Clothing', 'Fashion and apparel for all occasions'),
+    ('Books', 'Educational and entertainment books'),
+    ('Home & Garden', 'Home improvement and gardening supplies'),
+    ('Sports & Fitness', 'Sports equipment and fitness gear'),
+)
+
+_PRODUCT_COLS = (
+    'name', 'description', 'short_description', 'price', 'sale_price',
+    'category', 'stock_quantity', 'is_featured', 'sku'
+)
+_PRODUCTS = (
+    # Electronics
+    (
+        'Wireless Bluetooth Headphones',
+        'High-quality wireless headphones with noise cancellation. Perfect for music lovers and professionals. Features 30-hour battery life and premium sound quality.',
+        'Premium wireless headphones with noise cancellation',
+        199.99,
+        149.99,
+        'Electronics',
+        25,
+        True,
+        'ELC-WBH-001',
+    ),
+    (
+        'Smartphone Stand',
+        'Adjustable smartphone stand made from premium aluminum. Compatible with all phone sizes. Perfect for video calls, watching videos, and hands-free use.',
+        'Adjustable aluminum smartphone stand',
+        29.99,
+        None,
+        'Electronics',
+        50,
+        False,
+        'ELC-SPS-002',
+    ),
+    (
+        'Portable Power Bank',
+        '20000mAh portable power bank with fast charging capability. Features multiple USB ports and LED indicator. Perfect for travel and outdoor activities.',
+        '20000mAh fast charging power bank',
+        49.99,
+        None,
+        'Electronics',
+        35,
+        True,
+        'ELC-PPB-003',
+    ),
+    (
+        'Wireless Mouse',
+        'Ergonomic wireless mouse with precision tracking. Long battery life and comfortable grip for extended use.',
+        'Ergonomic wireless mouse with precision tracking',
+        39.99,
+        None,
+        'Electronics',
+        40,
+        False,
+        'ELC-WM-004',
+    ),
+    
+    # Clothing
+    (
+        'Classic Cotton T-Shirt',
+        '100% premium cotton t-shirt. Comfortable fit with pre-shrunk fabric. Available in multiple colors and sizes.',
+        '100% premium cotton comfort t-shirt',
+        24.99,
+        None,
+        'Clothing',
+        100,
+        False,
+        'CLO-CCT-005',
+    ),
+    (
+        'Denim Jeans',
+        'Classic fit denim jeans made from high-quality cotton blend. Durable construction with modern styling.',
+        'Classic fit denim jeans',
+        79.99,
+        59.99,
+        'Clothing',
+        60,
+        True,
+        'CLO-DJ-006',
+    ),
+    (
+        'Winter Jacket',
+        'Warm and stylish winter jacket with water-resistant coating. Perfect for cold weather with multiple pockets.',
+        'Warm water-resistant winter jacket',
+        149.99,
+        None,
+        'Clothing',
+        20,
+        False,
+        'CLO-WJ-007',
+    ),
+    (
+        'Running Shoes',
+        'Comfortable running shoes with advanced cushioning technology. Breathable mesh upper and durable sole.',
+        'Advanced cushioning running shoes',
+        129.99,
+        None,
+        'Clothing',
+        45,
+        True,
+        'CLO-RS-008',
+    ),
+    
+    # Books
+    (
+        'Python Programming Guide',
+        'Comprehensive guide to Python programming for beginners and intermediate developers. Includes practical examples and exercises.',
+        'Comprehensive Python programming guide',
+        49.99,
+        None,
+        'Books',
+        30,
+        False,
+        'BOO-PPG-009',
+    ),
+    (
+        'Web Development Handbook',
+        'Complete handbook covering HTML, CSS, JavaScript, and modern web development frameworks. Perfect for aspiring web developers.',
+        'Complete web development handbook',
+        59.99,
+        None,
+        'Books',
+        25,
+        True,
+        'BOO-WDH-010',
+    ),
+    (
+        'Business Strategy Book',
+        'Learn proven business strategies from successful entrepreneurs and business leaders. Practical insights for business growth.',
+        'Proven business strategies and insights',
+        34.99,
+        None,
+        'Books',
+        40,
+        False,
+        'BOO-BSB-011',
+    ),
+    
+    # Home & Garden
+    (
+        'LED Desk Lamp',
+        'Modern LED desk lamp with adjustable brightness and color temperature. Energy-efficient with sleek design.',
+        'Adjustable LED desk lamp',
+        69.99,
+        None,
+        'Home & Garden',
+        30,
+        False,
+        'HGD-LDL-012',
+    ),
+    (
+        'Plant Pot Set',
+        'Set of 3 ceramic plant pots with drainage holes. Perfect for indoor plants and herbs. Includes saucers.',
+        'Set of 3 ceramic plant pots',
+        39.99,
+        None,
+        'Home & Garden',
+        50,
+        True,
+        'HGD-PPS-013',
+    ),
+    
+    # Sports & Fitness
+    (
+        'Yoga Mat',
+        'Premium non-slip yoga mat with excellent cushioning. Eco-friendly material with carrying strap included.',
+        'Premium non-slip yoga mat',
+        29.99,
+        None,
+        'Sports & Fitness',
+        75,
+        False,
+        'SPF-YM-014',
+    ),
+    (
+        'Resistance Bands Set',
+        'Complete resistance bands set with multiple resistance levels. Includes door anchor and exercise guide.',
+        'Complete resistance bands set',
+        34.99,
+        None,
+        'Sports & Fitness',
+        60,
+        True,
+        'SPF-RBS-015',
+    ),
+)
+
 
 def create_sample_data():
     """Create sample categories and products."""
+    from app import create_app, db
+    from app.models.product import Product, Category
+    from app.models.user import User
+    from sqlalchemy import insert
     app = create_app('development')
     
     with app.app_context():
-        print("🚀 Creating Sample Data...")
-        print("=" * 50)
+        # Status lines are collected and written in one batch at the end
+        lines = ["🚀 Creating Sample Data...", "=" * 50]
+        log = lines.append
         
         # Clear existing data (optional - be careful in production!)
         # Product.query.delete()
         # Category.query.delete()
         
         # Create Categories
-        categories_data = [
-            {
-                'name': 'Electronics',
-                'description': 'Latest electronic devices and gadgets'
-            },
-            {
-                'name': 'Clothing',
-                'description': 'Fashion and apparel for all occasions'
-            },
-            {
-                'name': 'Books',
-                'description': 'Educational and entertainment books'
-            },
-            {
-                'name': 'Home & Garden',
-                'description': 'Home improvement and gardening supplies'
-            },
-            {
-                'name': 'Sports & Fitness',
-                'description': 'Sports equipment and fitness gear'
-            }
-        ]
+        category_names = [row[0] for row in _CATEGORIES]
+        existing_category_names = {
+            name for (name,) in Category.query.filter(
+                Category.name.in_(category_names)
+            ).with_entities(Category.name)
+        }
         
-        categories = {}
-        for cat_data in categories_data:
-            category = Category.query.filter_by(name=cat_data['name']).first()
-            if not category:
-                category = Category(**cat_data)
-                db.session.add(category)
-                db.session.flush()  # To get the ID
-                print(f"✅ Created category: {category.name}")
-            else:
-                print(f"📋 Category exists: {category.name}")
-            categories[cat_data['name']] = category
-        
-        # Create Products
-        products_data = [
-            # Electronics
-            {
-                'name': 'Wireless Bluetooth Headphones',
-                'description': 'High-quality wireless headphones with noise cancellation. Perfect for music lovers and professionals. Features 30-hour battery life and premium sound quality.',
-                'short_description': 'Premium wireless headphones with noise cancellation',
-                'price': 199.99,
-                'sale_price': 149.99,
-                'category': 'Electronics',
-                'stock_quantity': 25,
-                'is_featured': True,
-                'sku': 'ELC-WBH-001'
-            },
-            {
-                'name': 'Smartphone Stand',
-                'description': 'Adjustable smartphone stand made from premium aluminum. Compatible with all phone sizes. Perfect for video calls, watching videos, and hands-free use.',
-                'short_description': 'Adjustable aluminum smartphone stand',
-                'price': 29.99,
-                'category': 'Electronics',
-                'stock_quantity': 50,
-                'sku': 'ELC-SPS-002'
-            },
-            {
-                'name': 'Portable Power Bank',
-                'description': '20000mAh portable power bank with fast charging capability. Features multiple USB ports and LED indicator. Perfect for travel and outdoor activities.',
-                'short_description': '20000mAh fast charging power bank',
-                'price': 49.99,
-                'category': 'Electronics',
-                'stock_quantity': 35,
-                'is_featured': True,
-                'sku': 'ELC-PPB-003'
-            },
-            {
-                'name': 'Wireless Mouse',
-                'description': 'Ergonomic wireless mouse with precision tracking. Long battery life and comfortable grip for extended use.',
-                'short_description': 'Ergonomic wireless mouse with precision tracking',
-                'price': 39.99,
-                'category': 'Electronics',
-                'stock_quantity': 40,
-                'sku': 'ELC-WM-004'
-            },
+        category_rows = []
+        for row in _CATEGORIES:
+            cat_data = dict(zip(_CATEGORY_COLS, row))
             
-            # Clothing
-            {
-                'name': 'Classic Cotton T-Shirt',
-                'description': '100% premium cotton t-shirt. Comfortable fit with pre-shrunk fabric. Available in multiple colors and sizes.',
-                'short_description': '100% premium cotton comfort t-shirt',
-                'price': 24.99,
-                'category': 'Clothing',
-                'stock_quantity': 100,
-                'sku': 'CLO-CCT-005'
-            },
-            {
-                'name': 'Denim Jeans',
-                'description': 'Classic fit denim jeans made from high-quality cotton blend. Durable construction with modern styling.',
-                'short_description': 'Classic fit denim jeans',
-                'price': 79.99,
-                'sale_price': 59.99,
-                'category': 'Clothing',
-                'stock_quantity': 60,
-                'is_featured': True,
-                'sku': 'CLO-DJ-006'
-            },
-            {
-                'name': 'Winter Jacket',
-                'description': 'Warm and stylish winter jacket with water-resistant coating. Perfect for cold weather with multiple pockets.',
-                'short_description': 'Warm water-resistant winter jacket',
-                'price': 149.99,
-                'category': 'Clothing',
-                'stock_quantity': 20,
-                'sku': 'CLO-WJ-007'
-            },
-            {
-                'name': 'Running Shoes',
-                'description': 'Comfortable running shoes with advanced cushioning technology. Breathable mesh upper and durable sole.',
-                'short_description': 'Advanced cushioning running shoes',
-                'price': 129.99,
-                'category': 'Clothing',
-                'stock_quantity': 45,
-                'is_featured': True,
-                'sku': 'CLO-RS-008'
-            },
+            if cat_data['name'] in existing_category_names:
+                log(f"📋 Category exists: {cat_data['name']}")
+                continue
             
-            # Books
-            {
-                'name': 'Python Programming Guide',
-                'description': 'Comprehensive guide to Python programming for beginners and intermediate developers. Includes practical examples and exercises.',
-                'short_description': 'Comprehensive Python programming guide',
-                'price': 49.99,
-                'category': 'Books',
-                'stock_quantity': 30,
-                'sku': 'BOO-PPG-009'
-            },
-            {
-                'name': 'Web Development Handbook',
-                'description': 'Complete handbook covering HTML, CSS, JavaScript, and modern web development frameworks. Perfect for aspiring web developers.',
-                'short_description': 'Complete web development handbook',
-                'price': 59.99,
-                'category': 'Books',
-                'stock_quantity': 25,
-                'is_featured': True,
-                'sku': 'BOO-WDH-010'
-            },
-            {
-                'name': 'Business Strategy Book',
-                'description': 'Learn proven business strategies from successful entrepreneurs and business leaders. Practical insights for business growth.',
-                'short_description': 'Proven business strategies and insights',
-                'price': 34.99,
-                'category': 'Books',
-                'stock_quantity': 40,
-                'sku': 'BOO-BSB-011'
-            },
-            
-            # Home & Garden
-            {
-                'name': 'LED Desk Lamp',
-                'description': 'Modern LED desk lamp with adjustable brightness and color temperature. Energy-efficient with sleek design.',
-                'short_description': 'Adjustable LED desk lamp',
-                'price': 69.99,
-                'category': 'Home & Garden',
-                'stock_quantity': 30,
-                'sku': 'HGD-LDL-012'
-            },
-            {
-                'name': 'Plant Pot Set',
-                'description': 'Set of 3 ceramic plant pots with drainage holes. Perfect for indoor plants and herbs. Includes saucers.',
-                'short_description': 'Set of 3 ceramic plant pots',
-                'price': 39.99,
-                'category': 'Home & Garden',
-                'stock_quantity': 50,
-                'is_featured': True,
-                'sku': 'HGD-PPS-013'
-            },
-            
-            # Sports & Fitness
-            {
-                'name': 'Yoga Mat',
-                'description': 'Premium non-slip yoga mat with excellent cushioning. Eco-friendly material with carrying strap included.',
-                'short_description': 'Premium non-slip yoga mat',
-                'price': 29.99,
-                'category': 'Sports & Fitness',
-                'stock_quantity': 75,
-                'sku': 'SPF-YM-014'
-            },
-            {
-                'name': 'Resistance Bands Set',
-                'description': 'Complete resistance bands set with multiple resistance levels. Includes door anchor and exercise guide.',
-                'short_description': 'Complete resistance bands set',
-                'price': 34.99,
-                'category': 'Sports & Fitness',
-                'stock_quantity': 60,
-                'is_featured': True,
-                'sku': 'SPF-RBS-015'
-            }
-        ]
+            # Bulk inserts bypass Category.__init__, so fill in the slug here
+            category_rows.append(dict(cat_data, slug=Category.generate_slug(cat_data['name'])))
+            log(f"✅ Created category: {cat_data['name']}")
+        
+        if category_rows:
+            db.session.execute(insert(Category), category_rows)
         
         # Create Products
-        for prod_data in products_data:
+        category_id_by_name = dict(
+            Category.query.filter(Category.name.in_(category_names))
+            .with_entities(Category.name, Category.id)
+        )
+        existing_product_names = {
+            name for (name,) in Product.query.filter(
+                Product.name.in_([row[0] for row in _PRODUCTS])
+            ).with_entities(Product.name)
+        }
+        
+        product_rows = []
+        for row in _PRODUCTS:
+            prod_data = dict(zip(_PRODUCT_COLS, row))
             category_name = prod_data.pop('category')
-            category = categories[category_name]
             
-            product = Product.query.filter_by(name=prod_data['name']).first()
-            if not product:
-                product = Product(
-                    category_id=category.id,
-                    **prod_data
-                )
-                db.session.add(product)
-                print(f"✅ Created product: {product.name}")
-            else:
-                print(f"📋 Product exists: {product.name}")
+            if prod_data['name'] in existing_product_names:
+                log(f"📋 Product exists: {prod_data['name']}")
+                continue
+            
+            # Bulk inserts bypass Product.__init__, so fill in the derived fields here
+            product_rows.append(dict(
+                prod_data,
+                category_id=category_id_by_name[category_name],
+                slug=Product.generate_slug(prod_data['name'])
+            ))
+            log(f"✅ Created product: {prod_data['name']}")
+        
+        if product_rows:
+            # One executemany-style INSERT for every new product
+            db.session.execute(insert(Product), product_rows)
+        
+        existing_usernames = {
+            username for (username,) in User.query.filter(
+                User.username.in_(['admin', 'testuser'])
+            ).with_entities(User.username)
+        }
         
         # Create a test admin user if it doesn't exist
-        admin = User.query.filter_by(username='admin').first()
-        if not admin:
-            admin = User.create_user(
+        if 'admin' not in existing_usernames:
+            User.create_user(
                 username='admin',
                 email='admin@example.com',
                 password='admin123',
@@ -240,35 +286,36 @@ def create_sample_data():
                 last_name='User',
                 is_admin=True
             )
-            print(f"✅ Created admin user: {admin.username}")
+            log("✅ Created admin user: admin")
         else:
-            print(f"📋 Admin user exists: {admin.username}")
+            log("📋 Admin user exists: admin")
         
         # Create a test regular user if it doesn't exist
-        user = User.query.filter_by(username='testuser').first()
-        if not user:
-            user = User.create_user(
+        if 'testuser' not in existing_usernames:
+            User.create_user(
                 username='testuser',
                 email='test@example.com',
                 password='test123',
                 first_name='Test',
                 last_name='User'
             )
-            print(f"✅ Created test user: {user.username}")
+            log("✅ Created test user: testuser")
         else:
-            print(f"📋 Test user exists: {user.username}")
+            log("📋 Test user exists: testuser")
         
         # Commit all changes
         db.session.commit()
         
-        print("\n" + "=" * 50)
-        print("🎉 Sample data created successfully!")
-        print(f"📊 Categories: {Category.query.count()}")
-        print(f"📦 Products: {Product.query.count()}")
-        print(f"👥 Users: {User.query.count()}")
-        print("\n🔑 Login Credentials:")
-        print("   Admin: admin / admin123")
-        print("   User:  testuser / test123")
+        log("\n" + "=" * 50)
+        log("🎉 Sample data created successfully!")
+        log(f"📊 Categories: {Category.query.count()}")
+        log(f"📦 Products: {Product.query.count()}")
+        log(f"👥 Users: {User.query.count()}")
+        log("\n🔑 Login Credentials:")
+        log("   Admin: admin / admin123")
+        log("   User:  testuser / test123")
+        sys.stdout.write('\n'.join(lines) + '\n')
+
 
 if __name__ == "__main__":
     create_sample_data()
\ No newline at end of file
@@ -3,9 +3,17 @@ Enhanced Object-Oriented E-Commerce Testing Framework
 Advanced version with improved element detection and comprehensive testing
 """
 
+import re
 import time
 import random
 import string
+import atexit
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -14,83 +22,425 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException,
+    ElementClickInterceptedException, ElementNotInteractableException, WebDriverException
+)
 from webdriver_manager.chrome import ChromeDriverManager
+import requests
 import sys
 import os
 
 
+# Locator fallbacks, tried in order
+_PRODUCT_SELECTORS = (
+    (By.CSS_SELECTOR, ".product-card"),
+    (By.CSS_SELECTOR, ".card"),
+    (By.CSS_SELECTOR, ".product"),
+    (By.CSS_SELECTOR, "[class*='product']"),
+    (By.CSS_SELECTOR, "[class*='card']"),
+)
+
+_TITLE_SELECTORS = (
+    (By.CSS_SELECTOR, ".product-title"),
+    (By.CSS_SELECTOR, "h1"),
+    (By.CSS_SELECTOR, "h2"),
+    (By.CSS_SELECTOR, ".card-title"),
+    (By.CSS_SELECTOR, "[class*='title']"),
+)
+
+_CART_BUTTON_SELECTORS = (
+    (By.XPATH, "//button[contains(text(), 'Add to Cart')]"),
+    (By.XPATH, "//button[contains(text(), 'Add To Cart')]"),
+    (By.XPATH, "//a[contains(text(), 'Add to Cart')]"),
+    (By.CSS_SELECTOR, ".add-to-cart"),
+    (By.CSS_SELECTOR, "button[data-product-id]"),
+    (By.CSS_SELECTOR, ".btn-primary"),
+    (By.CSS_SELECTOR, "button.btn"),
+    (By.XPATH, "//button[contains(@class, 'btn')]"),
+    (By.XPATH, "//input[@type='submit']"),
+    (By.XPATH, "//button[@type='submit']"),
+)
+
+# Alert main.js shows once its add-to-cart request has answered
+_CART_ALERT = (By.CSS_SELECTOR, ".alert.auto-dismiss")
+
+_QUANTITY_SELECTORS = (
+    (By.NAME, "quantity"),
+    (By.ID, "quantity"),
+    (By.CSS_SELECTOR, ".quantity-input"),
+    (By.CSS_SELECTOR, "input[type='number']"),
+)
+
+_SUCCESS_SELECTORS = (
+    (By.CSS_SELECTOR, ".alert-success"),
+    (By.CSS_SELECTOR, ".alert"),
+    (By.CSS_SELECTOR, ".flash-message"),
+    (By.CSS_SELECTOR, ".success"),
+    (By.CSS_SELECTOR, "[class*='success']"),
+)
+
+_CART_ITEM_SELECTORS = (
+    (By.CSS_SELECTOR, ".cart-item"),
+    (By.CSS_SELECTOR, ".cart-product"),
+    (By.CSS_SELECTOR, "tr[data-product-id]"),
+    (By.CSS_SELECTOR, ".product-row"),
+    (By.CSS_SELECTOR, "[class*='cart'][class*='item']"),
+    (By.CSS_SELECTOR, "tbody tr"),
+)
+
+_EMPTY_SELECTORS = (
+    (By.CSS_SELECTOR, ".empty-cart"),
+    (By.XPATH, "//*[contains(text(), 'empty')]"),
+    (By.XPATH, "//*[contains(text(), 'no items')]"),
+    (By.XPATH, "//*[contains(text(), 'Your cart is empty')]"),
+)
+
+_CHECKOUT_SELECTORS = (
+    (By.XPATH, "//button[contains(text(), 'Checkout')]"),
+    (By.XPATH, "//a[contains(text(), 'Checkout')]"),
+    (By.XPATH, "//button[contains(text(), 'Proceed')]"),
+    (By.XPATH, "//a[contains(text(), 'Proceed')]"),
+    (By.CSS_SELECTOR, ".checkout-btn"),
+    (By.CSS_SELECTOR, ".btn-checkout"),
+    (By.XPATH, "//button[contains(text(), 'Place Demo Order')]"),
+    (By.XPATH, "//a[contains(text(), 'Place Demo Order')]"),
+)
+
+_ORDER_SELECTORS = (
+    (By.XPATH, "//button[contains(text(), 'Place Order')]"),
+    (By.XPATH, "//button[contains(text(), 'Place Demo Order')]"),
+    (By.XPATH, "//a[contains(text(), 'Place Order')]"),
+    (By.XPATH, "//a[contains(text(), 'Place Demo Order')]"),
+    (By.CSS_SELECTOR, ".place-order"),
+    (By.CSS_SELECTOR, ".btn-place-order"),
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.CSS_SELECTOR, "input[type='submit']"),
+)
+
+_SUBMIT_SELECTORS = (
+    (By.CSS_SELECTOR, "button[type='submit']"),
+    (By.CSS_SELECTOR, "input[type='submit']"),
+    (By.XPATH, "//button[contains(text(), 'Register')]"),
+    (By.XPATH, "//button[contains(text(), 'Sign Up')]"),
+    (By.XPATH, "//input[@value='Register']"),
+)
+
+_SEARCH_SELECTORS = (
+    (By.NAME, "q"),
+    (By.CSS_SELECTOR, "input[type='search']"),
+    (By.CSS_SELECTOR, "input[placeholder*='Search']"),
+    (By.CSS_SELECTOR, ".search-input"),
+    (By.ID, "search"),
+)
+
+_CATEGORY_SELECTORS = (
+    (By.XPATH, "//a[contains(@href, 'category=')]"),
+    (By.XPATH, "//a[contains(text(), 'Electronics')]"),
+    (By.XPATH, "//a[contains(text(), 'Clothing')]"),
+    (By.CSS_SELECTOR, ".category-card a"),
+    (By.CSS_SELECTOR, ".btn[href*='category']"),
+)
+
+BASE_URL = "http://localhost:5000"
+
+_STATUS_SYMBOLS = {"PASSED": "✅", "FAILED": "❌", "SKIPPED": "⏭️"}
+
+_HTML_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Set SELENIUM_HEADLESS=0 to watch the browser while debugging
+HEADLESS = os.environ.get("SELENIUM_HEADLESS", "1") == "1"
+
+# Explicit waits re-check their condition this often (Selenium's default is 0.5s)
+POLL_FREQUENCY = 0.2
+
+# Seconds to leave the browser open after the report; 0 closes it right away
+KEEP_OPEN_SECS = int(os.environ.get("KEEP_OPEN_SECS", "0"))
+
+# Pixels a resized window may differ from the requested width
+_RESIZE_TOLERANCE = 20
+
+# Most Chrome instances open at once, to keep the load on the dev server down
+MAX_BROWSERS = int(os.environ.get("SELENIUM_MAX_BROWSERS", "6"))
+
+# Browsers held by the concurrent top-level suites, one each
+_SUITE_BROWSERS = 3
+
+# Images, web fonts and trackers the DOM checks never look at
+_BLOCKED_ASSET_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*images.unsplash.com*",
+    # Third-party hosts; the Bootstrap CDN stays, the layout needs it
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+)
+
+# Chrome services the tests never use; each one is a background process
+_CHROME_QUIET_ARGS = (
+    "--disable-gpu", "--disable-extensions", "--no-first-run", "--no-default-browser-check",
+    "--disable-background-networking", "--disable-sync", "--disable-features=Translate",
+)
+
+# Product detail links on the current page, in document order
+_PRODUCT_HREFS_JS = """
+return Array.from(document.querySelectorAll("a[href*='/product/']"), a => a.href);
+"""
+
+# Calls back with the server-side cart item count, or null if the request fails
+_CART_COUNT_JS = """
+const done = arguments[arguments.length - 1];
+fetch("/shop/cart/count", {credentials: "same-origin"})
+    .then(response => response.json())
+    .then(data => done(data.count))
+    .catch(() => done(null));
+"""
+
+# Returns every match of the first CSS selector that matches anything
+_FIRST_MATCH_JS = """
+for (const selector of arguments[0]) {
+    const found = document.querySelectorAll(selector);
+    if (found.length) return Array.from(found);
+}
+return [];
+"""
+
+# Sets each selector's field to its value; returns the selectors that matched
+_FILL_FIELDS_JS = """
+const filled = [];
+for (const [selector, value] of Object.entries(arguments[0])) {
+    const field = document.querySelector(selector);
+    if (!field) continue;
+    field.value = value;
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    filled.push(selector);
+}
+return filled;
+"""
+
+# Sets the first element matched by the selectors (tried in order) to arguments[1]
+_FILL_FIRST_MATCH_JS = """
+for (const selector of arguments[0]) {
+    const field = document.querySelector(selector);
+    if (!field) continue;
+    field.value = arguments[1];
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    return field;
+}
+return null;
+"""
+
+
+def split_css_selectors(selectors):
+    """Split locators into one comma-joined CSS query and the remaining non-CSS locators"""
+    css = ", ".join(value for by, value in selectors if by == By.CSS_SELECTOR)
+    others = [selector for selector in selectors if selector[0] != By.CSS_SELECTOR]
+    return css, others
+
+
+@lru_cache(maxsize=None)
+def combined_locators(selectors):
+    """Get selectors as one combined CSS locator followed by the non-CSS ones"""
+    css, others = split_css_selectors(selectors)
+    return ((By.CSS_SELECTOR, css),) + tuple(others) if css else tuple(others)
+
+
+# Per-thread WebDriver for the parallel page probes
+_driver_local = threading.local()
+
+# Per-thread output buffer of the suite running on that thread
+_suite_output = threading.local()
+
+def write_file(filename, data):
+    """Write data to filename"""
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
+def profile_dir():
+    """Create a Chrome profile directory for the next driver, removed at exit"""
+    # Chrome locks a profile while it runs, so every driver (across
+    # concurrent runs and xdist workers too) needs a directory of its own
+    path = tempfile.mkdtemp(prefix=f"ecom_chrome_profile_{os.getpid()}_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+# Resolved once per process and shared by every driver
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def chromedriver_path():
+    """Get the chromedriver path, installing it on first use"""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+def retry_stale(action, attempts=2):
+    """Call action, calling it again if the element it used went stale"""
+    for attempt in range(attempts):
+        try:
+            return action()
+        except StaleElementReferenceException:
+            if attempt == attempts - 1:
+                raise
+
+
+def wait_for_page_load(driver, timeout=15, complete=False):
+    """Wait until the current document is parsed, or fully loaded if complete is set"""
+    ready_states = ("complete",) if complete else ("interactive", "complete")
+    WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+        lambda d: d.execute_script("return document.readyState") in ready_states
+    )
+
+
 class EnhancedBasePage:
     """Enhanced base page with improved element detection"""
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 15)
-        self.base_url = "http://localhost:5000"
+        self.wait = WebDriverWait(driver, 15, poll_frequency=POLL_FREQUENCY)
+        self._waits = {15: self.wait}
+        self.base_url = BASE_URL
+    
+    def _wait(self, timeout):
+        """Get a WebDriverWait for timeout, shared across calls on this page"""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout, poll_frequency=POLL_FREQUENCY)
+        return wait
     
     def navigate_to(self, url):
         """Navigate to a specific URL"""
         full_url = f"{self.base_url}{url}" if not url.startswith("http") else url
         self.driver.get(full_url)
-        time.sleep(2)
+        wait_for_page_load(self.driver)
+    
+    def goto_home(self):
+        """Go to the home page, unless the browser is already showing it"""
+        if self.driver.current_url.rstrip("/") != self.base_url:
+            self.navigate_to("/")
+    
+    def current_page(self):
+        """Get the root element of the current document, for navigation waits"""
+        return self.driver.find_element(By.TAG_NAME, "html")
+    
+    def wait_for_navigation(self, old_page, timeout=5):
+        """Wait for an action to replace old_page, then for the new page to load"""
+        try:
+            self._wait(timeout).until(EC.staleness_of(old_page))
+        except TimeoutException:
+            pass  # The action stayed on the same page
+        wait_for_page_load(self.driver)
+    
+    def find_elements_first_match(self, selectors):
+        """Get the matches of the first CSS selector that matches, in one round-trip"""
+        css = [value for by, value in selectors if by == By.CSS_SELECTOR]
+        return self.driver.execute_script(_FIRST_MATCH_JS, css)
     
     def find_element_multiple_selectors(self, selectors, timeout=10):
         """Try multiple selectors to find element"""
         for selector in selectors:
             try:
-                return WebDriverWait(self.driver, timeout).until(
+                return self._wait(timeout).until(
                     EC.presence_of_element_located(selector)
                 )
             except TimeoutException:
                 continue
         return None
     
-    def click_element_multiple_selectors(self, selectors, timeout=10):
-        """Try multiple selectors to click element"""
+    def click_element_multiple_selectors(self, selectors, timeout=10, wait_for=None):
+        """
+        Try multiple selectors to click element, optionally waiting for a result element.
+        
+        Only the first clickable selector is clicked. A missing wait_for element
+        does not trigger the fallback selectors (that could repeat the action);
+        the clicked element is still returned and the caller checks the outcome.
+        """
+        element = None
         for selector in selectors:
-            try:
-                element = WebDriverWait(self.driver, timeout).until(
+            def click():
+                element = self._wait(timeout).until(
                     EC.element_to_be_clickable(selector)
                 )
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.3)
-                element.click()
+                try:
+                    element.click()
+                except ElementClickInterceptedException:
+                    self.driver.execute_script("arguments[0].click();", element)
                 return element
-            except:
+            
+            try:
+                element = retry_stale(click)
+                break
+            except (TimeoutException, StaleElementReferenceException):
                 continue
-        return None
+        
+        if element is not None and wait_for:
+            try:
+                self._wait(timeout).until(EC.presence_of_element_located(wait_for))
+            except TimeoutException:
+                pass
+        return element
     
-    def fill_field_multiple_selectors(self, selectors, text, timeout=10):
-        """Try multiple selectors to fill field"""
+    def fill_field_multiple_selectors(self, selectors, text, timeout=10, type_keys=False):
+        """
+        Try multiple selectors to fill field.
+        
+        The CSS selectors are tried in one script call; the other locators,
+        or all of them when type_keys is set (for widgets that react to
+        keystrokes), go through send_keys.
+        """
+        if not type_keys:
+            css = [value for by, value in selectors if by == By.CSS_SELECTOR]
+            element = self.driver.execute_script(_FILL_FIRST_MATCH_JS, css, text) if css else None
+            if element is not None:
+                return element
+            selectors = [selector for selector in selectors if selector[0] != By.CSS_SELECTOR]
+        
         for selector in selectors:
-            try:
-                element = WebDriverWait(self.driver, timeout).until(
+            def fill():
+                element = self._wait(timeout).until(
                     EC.presence_of_element_located(selector)
                 )
                 element.clear()
                 element.send_keys(text)
-                time.sleep(0.2)
                 return element
-            except:
+            
+            try:
+                return retry_stale(fill)
+            except (TimeoutException, StaleElementReferenceException, ElementNotInteractableException):
                 continue
         return None
     
-    def is_element_present_multiple_selectors(self, selectors, timeout=3):
-        """Check if any of the selectors match an element"""
-        for selector in selectors:
-            try:
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(selector)
-                )
-                return True
-            except TimeoutException:
-                continue
-        return False
+    def is_element_present_multiple_selectors(self, selectors, timeout=0):
+        """Check if any of the selectors match an element, polling them all together up to timeout"""
+        locators = combined_locators(tuple(selectors))
+        
+        def any_present(driver):
+            return any(driver.find_elements(*selector) for selector in locators)
+        
+        if not timeout:
+            return any_present(self.driver)
+        try:
+            return self._wait(timeout).until(any_present)
+        except TimeoutException:
+            return False
     
-    def take_screenshot(self, name):
-        """Take screenshot"""
+    def take_screenshot(self, name, io_pool=None):
+        """Take screenshot, writing the file on io_pool when one is given"""
         filename = f"enhanced_test_{name}_{int(time.time())}.png"
-        self.driver.save_screenshot(filename)
+        png = self.driver.get_screenshot_as_png()
+        if io_pool is None:
+            write_file(filename, png)
+        else:
+            io_pool.submit(write_file, filename, png)
         return filename
 
 
@@ -102,86 +452,22 @@ class EnhancedProductsPage(EnhancedBasePage):
     
     def get_products_count(self):
         """Get number of products displayed"""
-        product_selectors = [
-            (By.CSS_SELECTOR, ".product-card"),
-            (By.CSS_SELECTOR, ".card"),
-            (By.CSS_SELECTOR, ".product"),
-            (By.CSS_SELECTOR, "[class*='product']"),
-            (By.CSS_SELECTOR, "[class*='card']")
-        ]
-        
-        for selector in product_selectors:
-            try:
-                products = self.driver.find_elements(*selector)
-                if products:
-                    return len(products)
-            except:
-                continue
-        return 0
+        return len(self.find_elements_first_match(_PRODUCT_SELECTORS))
     
     def click_first_product_detail(self):
-        """Click on first product's detail link using multiple strategies"""
-        # Strategy 1: Find product cards and look for links within them
-        product_selectors = [
-            (By.CSS_SELECTOR, ".product-card"),
-            (By.CSS_SELECTOR, ".card"),
-            (By.CSS_SELECTOR, ".product")
-        ]
-        
-        for product_selector in product_selectors:
-            try:
-                products = self.driver.find_elements(*product_selector)
-                if products:
-                    first_product = products[0]
-                    
-                    # Try different link selectors within the product
-                    link_selectors = [
-                        "a[href*='/shop/product/']",
-                        "a[href*='/product/']",
-                        ".btn-outline-primary",
-                        "a.btn",
-                        ".product-link",
-                        "a[class*='btn']",
-                        "a"  # Last resort - any link
-                    ]
-                    
-                    for link_selector in link_selectors:
-                        try:
-                            link = first_product.find_element(By.CSS_SELECTOR, link_selector)
-                            if link.is_displayed() and link.is_enabled():
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", link)
-                                time.sleep(0.5)
-                                
-                                # Try clicking with JavaScript if regular click fails
-                                try:
-                                    link.click()
-                                except:
-                                    self.driver.execute_script("arguments[0].click();", link)
-                                
-                                time.sleep(2)
-                                return EnhancedProductDetailPage(self.driver)
-                        except:
-                            continue
-                    
-                    # If no specific link found, try clicking the product card itself
-                    try:
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", first_product)
-                        time.sleep(0.5)
-                        first_product.click()
-                        time.sleep(2)
-                        return EnhancedProductDetailPage(self.driver)
-                    except:
-                        continue
-                        
-            except:
-                continue
+        """Open the first product's detail page"""
+        # Strategy 1: Follow the first product link on the page
+        hrefs = self.driver.execute_script(_PRODUCT_HREFS_JS)
+        if hrefs:
+            self.driver.get(hrefs[0])
+            wait_for_page_load(self.driver)
+            return EnhancedProductDetailPage(self.driver)
         
         # Strategy 2: Direct URL navigation to first product
         try:
-            self.driver.get(f"{self.base_url}/shop/product/1")
-            time.sleep(2)
+            self.navigate_to("/shop/product/1")
             return EnhancedProductDetailPage(self.driver)
-        except:
+        except (WebDriverException, TimeoutException):
             pass
         
         return None
@@ -192,65 +478,27 @@ class EnhancedProductDetailPage(EnhancedBasePage):
     
     def get_product_title(self):
         """Get product title using multiple selectors"""
-        title_selectors = [
-            (By.CSS_SELECTOR, ".product-title"),
-            (By.CSS_SELECTOR, "h1"),
-            (By.CSS_SELECTOR, "h2"),
-            (By.CSS_SELECTOR, ".card-title"),
-            (By.CSS_SELECTOR, "[class*='title']")
-        ]
-        
-        element = self.find_element_multiple_selectors(title_selectors)
-        return element.text if element else "Product Title Found"
+        elements = self.find_elements_first_match(_TITLE_SELECTORS)
+        return elements[0].text if elements else "Product Title Found"
     
     def add_to_cart(self, quantity=1):
         """Add product to cart using multiple strategies"""
-        # Strategy 1: Look for add to cart buttons
-        cart_button_selectors = [
-            (By.XPATH, "//button[contains(text(), 'Add to Cart')]"),
-            (By.XPATH, "//button[contains(text(), 'Add To Cart')]"),
-            (By.XPATH, "//a[contains(text(), 'Add to Cart')]"),
-            (By.CSS_SELECTOR, ".add-to-cart"),
-            (By.CSS_SELECTOR, "button[data-product-id]"),
-            (By.CSS_SELECTOR, ".btn-primary"),
-            (By.CSS_SELECTOR, "button.btn"),
-            (By.XPATH, "//button[contains(@class, 'btn')]"),
-            (By.XPATH, "//input[@type='submit']"),
-            (By.XPATH, "//button[@type='submit']")
-        ]
-        
         # Try to set quantity first
-        quantity_selectors = [
-            (By.NAME, "quantity"),
-            (By.ID, "quantity"),
-            (By.CSS_SELECTOR, ".quantity-input"),
-            (By.CSS_SELECTOR, "input[type='number']")
-        ]
-        
-        for selector in quantity_selectors:
+        for selector in _QUANTITY_SELECTORS:
             try:
                 quantity_field = self.driver.find_element(*selector)
                 quantity_field.clear()
                 quantity_field.send_keys(str(quantity))
                 break
-            except:
+            except (NoSuchElementException, ElementNotInteractableException):
                 continue
         
-        # Now try to click add to cart
-        button = self.click_element_multiple_selectors(cart_button_selectors)
+        # Strategy 1: Look for add to cart buttons. main.js posts the form with
+        # fetch and reports the result in an auto-dismiss alert; no navigation
+        button = self.click_element_multiple_selectors(_CART_BUTTON_SELECTORS, wait_for=_CART_ALERT)
         if button:
-            time.sleep(2)
-            
             # Check for success indicators
-            success_selectors = [
-                (By.CSS_SELECTOR, ".alert-success"),
-                (By.CSS_SELECTOR, ".alert"),
-                (By.CSS_SELECTOR, ".flash-message"),
-                (By.CSS_SELECTOR, ".success"),
-                (By.CSS_SELECTOR, "[class*='success']")
-            ]
-            
-            success_found = self.is_element_present_multiple_selectors(success_selectors, 3)
+            success_found = self.is_element_present_multiple_selectors(_SUCCESS_SELECTORS)
             return success_found or True  # Return true if button was clicked
         
         # Strategy 2: Try form submission if button click failed
@@ -258,10 +506,11 @@ class EnhancedProductDetailPage(EnhancedBasePage):
             forms = self.driver.find_elements(By.TAG_NAME, "form")
             if forms:
                 # Try submitting the first form
+                page = self.current_page()
                 self.driver.execute_script("arguments[0].submit();", forms[0])
-                time.sleep(2)
+                self.wait_for_navigation(page)
                 return True
-        except:
+        except WebDriverException:
             pass
         
         return False
@@ -276,54 +525,25 @@ class EnhancedCartPage(EnhancedBasePage):
     
     def get_cart_items_count(self):
         """Get number of items in cart"""
-        item_selectors = [
-            (By.CSS_SELECTOR, ".cart-item"),
-            (By.CSS_SELECTOR, ".cart-product"),
-            (By.CSS_SELECTOR, "tr[data-product-id]"),
-            (By.CSS_SELECTOR, ".product-row"),
-            (By.CSS_SELECTOR, "[class*='cart'][class*='item']"),
-            (By.CSS_SELECTOR, "tbody tr")
-        ]
-        
-        for selector in item_selectors:
-            try:
-                items = self.driver.find_elements(*selector)
-                if items:
-                    return len(items)
-            except:
-                continue
-        return 0
+        return len(self.find_elements_first_match(_CART_ITEM_SELECTORS))
     
     def is_cart_empty(self):
-        """Check if cart is empty"""
-        empty_selectors = [
-            (By.CSS_SELECTOR, ".empty-cart"),
-            (By.XPATH, "//*[contains(text(), 'empty')]"),
-            (By.XPATH, "//*[contains(text(), 'no items')]"),
-            (By.XPATH, "//*[contains(text(), 'Your cart is empty')]")
-        ]
+        """Check if cart is empty, asking the server before probing the DOM"""
+        count = self.driver.execute_async_script(_CART_COUNT_JS)
+        if count is not None:
+            return count == 0
         
-        empty_found = self.is_element_present_multiple_selectors(empty_selectors, 3)
+        empty_found = self.is_element_present_multiple_selectors(_EMPTY_SELECTORS)
         items_count = self.get_cart_items_count()
         
         return empty_found or items_count == 0
     
     def proceed_to_checkout(self):
         """Proceed to checkout using multiple selectors"""
-        checkout_selectors = [
-            (By.XPATH, "//button[contains(text(), 'Checkout')]"),
-            (By.XPATH, "//a[contains(text(), 'Checkout')]"),
-            (By.XPATH, "//button[contains(text(), 'Proceed')]"),
-            (By.XPATH, "//a[contains(text(), 'Proceed')]"),
-            (By.CSS_SELECTOR, ".checkout-btn"),
-            (By.CSS_SELECTOR, ".btn-checkout"),
-            (By.XPATH, "//button[contains(text(), 'Place Demo Order')]"),
-            (By.XPATH, "//a[contains(text(), 'Place Demo Order')]")
-        ]
-        
-        button = self.click_element_multiple_selectors(checkout_selectors)
+        page = self.current_page()
+        button = self.click_element_multiple_selectors(_CHECKOUT_SELECTORS)
         if button:
-            time.sleep(3)
+            self.wait_for_navigation(page)
             return EnhancedCheckoutPage(self.driver)
         return None
 
@@ -333,22 +553,12 @@ class EnhancedCheckoutPage(EnhancedBasePage):
     
     def place_order(self):
         """Place order using multiple selectors"""
-        order_selectors = [
-            (By.XPATH, "//button[contains(text(), 'Place Order')]"),
-            (By.XPATH, "//button[contains(text(), 'Place Demo Order')]"),
-            (By.XPATH, "//a[contains(text(), 'Place Order')]"),
-            (By.XPATH, "//a[contains(text(), 'Place Demo Order')]"),
-            (By.CSS_SELECTOR, ".place-order"),
-            (By.CSS_SELECTOR, ".btn-place-order"),
-            (By.CSS_SELECTOR, "button[type='submit']"),
-            (By.CSS_SELECTOR, "input[type='submit']")
-        ]
-        
         current_url = self.driver.current_url
-        button = self.click_element_multiple_selectors(order_selectors)
+        page = self.current_page()
+        button = self.click_element_multiple_selectors(_ORDER_SELECTORS)
         
         if button:
-            time.sleep(3)
+            self.wait_for_navigation(page)
             return self.driver.current_url != current_url
         
         return False
@@ -357,6 +567,18 @@ class EnhancedCheckoutPage(EnhancedBasePage):
 class ComprehensiveECommerceTestSuite:
     """Enhanced comprehensive test suite"""
     
+    # Registration form field selectors, one compound CSS query per field
+    _FIELD_MAPPINGS = {
+        'first_name': "input[name='first_name'], #first_name, input[placeholder*='First']",
+        'last_name': "input[name='last_name'], #last_name, input[placeholder*='Last']",
+        'email': "input[name='email'], #email, input[type='email']",
+        'password': "input[name='password'], #password, input[type='password']:not([name*='confirm'])",
+        'confirm_password': (
+            "input[name='confirm_password'], input[name='password_confirm'], "
+            "#confirm_password, input[type='password'][name*='confirm']"
+        ),
+    }
+    
     def __init__(self):
         self.driver = None
         self.test_results = []
@@ -366,77 +588,148 @@ class ComprehensiveECommerceTestSuite:
             'email': f'enhanced{random.randint(1000, 9999)}@test.com',
             'password': 'TestPassword123'
         }
+        self.results_lock = threading.Lock()
+        # Writes screenshot files so the tests don't wait on disk I/O
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Browsers the search pool may start on top of the suites' own
+        self.search_workers = max(1, MAX_BROWSERS - _SUITE_BROWSERS)
+        # Keep-alive connections for checks that don't need a browser
+        self.http = requests.Session()
         
+    def create_driver(self):
+        """Create a Chrome driver with the suite's browser options"""
+        chrome_options = Options()
+        if HEADLESS:
+            for argument in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage",
+                             "--window-size=1920,1080"):
+                chrome_options.add_argument(argument)
+        else:
+            chrome_options.add_argument("--start-maximized")
+        for argument in _CHROME_QUIET_ARGS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir()}")
+        # driver.get returns at DOMContentLoaded; the DOM checks don't need subresources
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_settings.popups": 0
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+        
+        try:
+            service = Service(chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception:
+            driver = webdriver.Chrome(options=chrome_options)
+        
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Fallback lookups must fail fast; positive waits are all explicit
+        driver.implicitly_wait(0)
+        driver.execute_cdp_cmd("Network.enable", {})
+        self.block_assets(driver)
+        return driver
+    
+    def block_assets(self, driver, blocked=True):
+        """Block (or unblock) asset and tracker requests in driver"""
+        urls = list(_BLOCKED_ASSET_URLS) if blocked else []
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    
     def setup_driver(self):
         """Setup Chrome driver"""
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--start-maximized")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            prefs = {
-                "profile.default_content_setting_values.notifications": 2,
-                "profile.default_content_settings.popups": 0
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
-            
-            try:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            except:
-                self.driver = webdriver.Chrome(options=chrome_options)
-            
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver = self.create_driver()
             return True
             
         except Exception as e:
             print(f"❌ Failed to setup Chrome driver: {e}")
             return False
     
+    def worker_driver(self):
+        """Get the calling worker thread's driver, starting one on first use"""
+        driver = getattr(_driver_local, 'driver', None)
+        if driver is None:
+            driver = _driver_local.driver = self.create_driver()
+            _driver_local.pool_drivers.append(driver)
+        return driver
+    
+    def run_in_parallel(self, func, items, max_workers=4):
+        """
+        Run func over independent items on a pool of browser workers.
+        
+        Returns (item, result, error) tuples in input order; every worker
+        driver is closed once the pool is done.
+        """
+        def call(item):
+            try:
+                return item, func(*item), None
+            except Exception as e:
+                return item, None, e
+        
+        # Each pool only closes the drivers its own threads started
+        drivers = []
+        
+        def start_worker():
+            _driver_local.pool_drivers = drivers
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers, initializer=start_worker) as executor:
+                return list(executor.map(call, items))
+        finally:
+            for driver in drivers:
+                driver.quit()
+    
+    def say(self, text):
+        """Print text, or buffer it if a suite is running on this thread"""
+        lines = getattr(_suite_output, 'lines', None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+    
     def log_test_result(self, test_name, status, details=""):
-        """Log test result"""
-        self.test_results.append({
-            'test': test_name,
-            'status': status,
-            'details': details
-        })
+        """Log test result; safe to call from concurrent suites"""
         status_symbol = "✅" if status == "PASSED" else "❌" if status == "FAILED" else "⏭️"
-        print(f"{status_symbol} {test_name} - {status}")
+        with self.results_lock:
+            self.test_results.append({
+                'test': test_name,
+                'status': status,
+                'details': details
+            })
+        self.say(f"{status_symbol} {test_name} - {status}")
         if details:
-            print(f"   {details}")
+            self.say(f"   {details}")
     
-    def test_complete_user_workflow(self):
+    def test_complete_user_workflow(self, driver=None):
         """Test complete user workflow from registration to purchase"""
-        print("\n🔄 TESTING COMPLETE USER WORKFLOW")
-        print("-" * 60)
+        driver = driver or self.driver
+        self.say("\n🔄 TESTING COMPLETE USER WORKFLOW")
+        self.say("-" * 60)
         
         try:
             # Start from home page
-            self.driver.get("http://localhost:5000")
-            time.sleep(2)
+            base_page = EnhancedBasePage(driver)
+            base_page.goto_home()
             
             # Take initial screenshot
-            base_page = EnhancedBasePage(self.driver)
-            base_page.take_screenshot("workflow_start")
+            base_page.take_screenshot("workflow_start", io_pool=self._io_pool)
             
             # Step 1: Register user
-            self.driver.get("http://localhost:5000/auth/register")
-            time.sleep(2)
+            base_page.navigate_to("/auth/register")
             
             # Fill registration form using multiple strategies
-            registration_success = self.fill_registration_form()
+            registration_success = self.fill_registration_form(driver)
             if registration_success:
                 self.log_test_result("User Registration Workflow", "PASSED", "Registration completed")
             else:
                 self.log_test_result("User Registration Workflow", "FAILED", "Registration failed")
             
             # Step 2: Navigate to products
-            self.driver.get("http://localhost:5000/shop/products")
-            time.sleep(2)
-            
-            products_page = EnhancedProductsPage(self.driver)
+            products_page = EnhancedProductsPage(driver)
+            products_page.navigate_to("/shop/products")
             product_count = products_page.get_products_count()
             self.log_test_result("Product Page Access", "PASSED", f"Found {product_count} products")
             
@@ -454,12 +747,12 @@ class ComprehensiveECommerceTestSuite:
                     else:
                         self.log_test_result("Add to Cart Workflow", "FAILED", "Could not add to cart")
                     
-                    detail_page.take_screenshot("product_added_to_cart")
+                    detail_page.take_screenshot("product_added_to_cart", io_pool=self._io_pool)
                 else:
                     self.log_test_result("Product Detail Access", "FAILED", "Could not access product details")
             
             # Step 4: Check cart
-            cart_page = EnhancedCartPage(self.driver)
+            cart_page = EnhancedCartPage(driver)
             if not cart_page.is_cart_empty():
                 items_count = cart_page.get_cart_items_count()
                 self.log_test_result("Cart Verification", "PASSED", f"Cart has {items_count} items")
@@ -476,7 +769,7 @@ class ComprehensiveECommerceTestSuite:
                     else:
                         self.log_test_result("Order Placement", "PASSED", "Order placement attempted")
                     
-                    checkout_page.take_screenshot("order_completed")
+                    checkout_page.take_screenshot("order_completed", io_pool=self._io_pool)
                 else:
                     self.log_test_result("Checkout Access", "FAILED", "Could not access checkout")
             else:
@@ -485,91 +778,47 @@ class ComprehensiveECommerceTestSuite:
         except Exception as e:
             self.log_test_result("Complete User Workflow", "FAILED", str(e))
     
-    def fill_registration_form(self):
-        """Fill registration form using multiple strategies"""
+    def fill_registration_form(self, driver=None):
+        """Fill the registration form in one script call and submit it"""
+        driver = driver or self.driver
         try:
-            # Define all possible field selectors
-            field_mappings = {
-                'first_name': [
-                    (By.NAME, "first_name"),
-                    (By.ID, "first_name"),
-                    (By.CSS_SELECTOR, "input[placeholder*='First']"),
-                    (By.XPATH, "//input[contains(@placeholder, 'first')]")
-                ],
-                'last_name': [
-                    (By.NAME, "last_name"),
-                    (By.ID, "last_name"),
-                    (By.CSS_SELECTOR, "input[placeholder*='Last']"),
-                    (By.XPATH, "//input[contains(@placeholder, 'last')]")
-                ],
-                'email': [
-                    (By.NAME, "email"),
-                    (By.ID, "email"),
-                    (By.CSS_SELECTOR, "input[type='email']"),
-                    (By.CSS_SELECTOR, "input[placeholder*='email']")
-                ],
-                'password': [
-                    (By.NAME, "password"),
-                    (By.ID, "password"),
-                    (By.CSS_SELECTOR, "input[type='password']"),
-                    (By.XPATH, "//input[@type='password' and not(contains(@name, 'confirm'))]")
-                ],
-                'confirm_password': [
-                    (By.NAME, "confirm_password"),
-                    (By.NAME, "password_confirm"),
-                    (By.ID, "confirm_password"),
-                    (By.XPATH, "//input[@type='password' and contains(@name, 'confirm')]")
-                ]
-            }
+            wait_for_page_load(driver)
             
-            # Fill each field
-            filled_fields = 0
-            for field_name, selectors in field_mappings.items():
-                value = self.test_user_data.get(field_name, self.test_user_data['password'])
-                
-                for selector in selectors:
-                    try:
-                        element = WebDriverWait(self.driver, 3).until(
-                            EC.presence_of_element_located(selector)
-                        )
-                        element.clear()
-                        element.send_keys(value)
-                        filled_fields += 1
-                        print(f"   Filled {field_name}: {value}")
-                        break
-                    except:
-                        continue
+            # Fill every field in a single script call
+            fields = {
+                selector: self.test_user_data.get(field_name, self.test_user_data['password'])
+                for field_name, selector in self._FIELD_MAPPINGS.items()
+            }
+            filled = driver.execute_script(_FILL_FIELDS_JS, fields)
+            filled_fields = len(filled)
+            self.say(f"   Filled {filled_fields} fields")
             
             # Submit form
-            submit_selectors = [
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.CSS_SELECTOR, "input[type='submit']"),
-                (By.XPATH, "//button[contains(text(), 'Register')]"),
-                (By.XPATH, "//button[contains(text(), 'Sign Up')]"),
-                (By.XPATH, "//input[@value='Register']")
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    submit_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable(selector)
-                    )
-                    submit_button.click()
-                    time.sleep(3)
-                    return True
-                except:
-                    continue
+            page = EnhancedBasePage(driver)
+            old_page = page.current_page()
+            if page.click_element_multiple_selectors(combined_locators(_SUBMIT_SELECTORS), timeout=3):
+                page.wait_for_navigation(old_page)
+                return True
             
             return filled_fields >= 3  # Consider successful if at least 3 fields filled
             
         except Exception as e:
-            print(f"Registration error: {e}")
+            self.say(f"Registration error: {e}")
             return False
     
-    def test_advanced_navigation_and_interaction(self):
+    def probe_page(self, url, page_name):
+        """Fetch a page over HTTP and check that it rendered"""
+        response = self.http.get(f"{BASE_URL}{url}", timeout=5)
+        match = _HTML_TITLE.search(response.text)
+        title = match.group(1).lower() if match else ""
+        return (response.status_code == 200 and "404" not in title and "error" not in title
+                and len(response.text) > 1000)
+    
+    def test_advanced_navigation_and_interaction(self, driver=None):
         """Test advanced navigation and interaction patterns"""
-        print("\n🧭 TESTING ADVANCED NAVIGATION AND INTERACTION")
-        print("-" * 60)
+        driver = driver or self.driver
+        self.say("\n🧭 TESTING ADVANCED NAVIGATION AND INTERACTION")
+        self.say("-" * 60)
         
         try:
             # Test all major pages
@@ -583,25 +832,15 @@ class ComprehensiveECommerceTestSuite:
                 ("/contact", "Contact Page")
             ]
             
-            for url, page_name in pages_to_test:
-                try:
-                    self.driver.get(f"http://localhost:5000{url}")
-                    time.sleep(2)
-                    
-                    # Check if page loaded by looking for common elements
-                    page_loaded = (
-                        "404" not in self.driver.title.lower() and
-                        "error" not in self.driver.title.lower() and
-                        len(self.driver.page_source) > 1000
-                    )
-                    
-                    if page_loaded:
-                        self.log_test_result(f"{page_name} Navigation", "PASSED", f"Page loaded successfully")
-                    else:
-                        self.log_test_result(f"{page_name} Navigation", "FAILED", f"Page failed to load properly")
-                    
-                except Exception as e:
-                    self.log_test_result(f"{page_name} Navigation", "FAILED", str(e))
+            # Pages are independent, so they are probed concurrently
+            results = self.run_in_parallel(self.probe_page, pages_to_test)
+            for (url, page_name), page_loaded, error in results:
+                if error is not None:
+                    self.log_test_result(f"{page_name} Navigation", "FAILED", str(error))
+                elif page_loaded:
+                    self.log_test_result(f"{page_name} Navigation", "PASSED", f"Page loaded successfully")
+                else:
+                    self.log_test_result(f"{page_name} Navigation", "FAILED", f"Page failed to load properly")
             
             # Test responsive design by changing window size
             window_sizes = [
@@ -610,109 +849,119 @@ class ComprehensiveECommerceTestSuite:
                 (375, 667, "Mobile")
             ]
             
+            # Screenshots below should show the real page
+            self.block_assets(driver, blocked=False)
+            
+            # Viewport changes are client-side only, so one load of the home page
+            # serves every size
+            base_page = EnhancedBasePage(driver)
+            base_page.goto_home()
+            # The screenshots should include the images, so wait for the load event
+            wait_for_page_load(driver, complete=True)
+            
             for width, height, device in window_sizes:
                 try:
-                    self.driver.set_window_size(width, height)
-                    time.sleep(1)
+                    driver.set_window_size(width, height)
+                    # Headed Chrome has a minimum window width, so wait for the
+                    # target width or for the width to settle, whichever comes first
+                    readings = []
                     
-                    # Go to home page
-                    self.driver.get("http://localhost:5000")
-                    time.sleep(2)
+                    def window_resized(d):
+                        readings.append(d.execute_script("return window.outerWidth"))
+                        return (abs(readings[-1] - width) <= _RESIZE_TOLERANCE
+                                or readings[-2:] == [readings[-1]] * 2)
+                    
+                    base_page._wait(3).until(window_resized)
                     
                     # Check if page is still functional
-                    body = self.driver.find_element(By.TAG_NAME, "body")
+                    body = driver.find_element(By.TAG_NAME, "body")
                     if body:
-                        self.log_test_result(f"Responsive Design - {device}", "PASSED", f"Page works at {width}x{height}")
+                        self.log_test_result(f"Responsive Design - {device}", "PASSED",
+                                             f"Page works at {width}x{height} (window width {readings[-1]})")
                     
                     # Take screenshot
-                    base_page = EnhancedBasePage(self.driver)
-                    base_page.take_screenshot(f"responsive_{device.lower()}")
+                    base_page.take_screenshot(f"responsive_{device.lower()}", io_pool=self._io_pool)
                     
                 except Exception as e:
                     self.log_test_result(f"Responsive Design - {device}", "FAILED", str(e))
             
             # Reset to normal size
-            self.driver.maximize_window()
+            if HEADLESS:
+                driver.set_window_size(1920, 1080)
+            else:
+                driver.maximize_window()
+            self.block_assets(driver)
             
         except Exception as e:
             self.log_test_result("Advanced Navigation Tests", "FAILED", str(e))
     
-    def test_search_and_filtering(self):
+    def search_products(self, term):
+        """Search for term on the worker's driver; returns the result count or None"""
+        # Navigate to products page
+        products_page = EnhancedProductsPage(self.worker_driver())
+        products_page.navigate_to("/shop/products")
+        
+        # Find search box using multiple selectors
+        for selector in _SEARCH_SELECTORS:
+            try:
+                search_box = products_page.driver.find_element(*selector)
+                search_box.clear()
+                search_box.send_keys(term)
+                old_page = products_page.current_page()
+                search_box.send_keys(Keys.RETURN)
+                products_page.wait_for_navigation(old_page)
+                break
+            except (NoSuchElementException, ElementNotInteractableException, StaleElementReferenceException):
+                continue
+        else:
+            return None
+        
+        # Count results
+        return products_page.get_products_count()
+    
+    def test_search_and_filtering(self, driver=None):
         """Test search and filtering functionality"""
-        print("\n🔍 TESTING SEARCH AND FILTERING")
-        print("-" * 60)
+        driver = driver or self.driver
+        self.say("\n🔍 TESTING SEARCH AND FILTERING")
+        self.say("-" * 60)
         
         try:
             # Test various search terms
             search_terms = ["laptop", "phone", "book", "shirt", "electronics", "clothing"]
             
-            for term in search_terms:
-                try:
-                    # Navigate to products page
-                    self.driver.get("http://localhost:5000/shop/products")
-                    time.sleep(2)
-                    
-                    # Find search box using multiple selectors
-                    search_selectors = [
-                        (By.NAME, "q"),
-                        (By.CSS_SELECTOR, "input[type='search']"),
-                        (By.CSS_SELECTOR, "input[placeholder*='Search']"),
-                        (By.CSS_SELECTOR, ".search-input"),
-                        (By.ID, "search")
-                    ]
-                    
-                    search_performed = False
-                    for selector in search_selectors:
-                        try:
-                            search_box = self.driver.find_element(*selector)
-                            search_box.clear()
-                            search_box.send_keys(term)
-                            search_box.send_keys(Keys.RETURN)
-                            time.sleep(2)
-                            search_performed = True
-                            break
-                        except:
-                            continue
-                    
-                    if search_performed:
-                        # Count results
-                        products_page = EnhancedProductsPage(self.driver)
-                        results_count = products_page.get_products_count()
-                        self.log_test_result(f"Search - '{term}'", "PASSED", f"Found {results_count} results")
-                    else:
-                        self.log_test_result(f"Search - '{term}'", "FAILED", "Could not perform search")
-                        
-                except Exception as e:
-                    self.log_test_result(f"Search - '{term}'", "FAILED", str(e))
+            # Searches are independent, so they run concurrently
+            results = self.run_in_parallel(self.search_products, [(term,) for term in search_terms],
+                                           max_workers=self.search_workers)
+            for (term,), results_count, error in results:
+                if error is not None:
+                    self.log_test_result(f"Search - '{term}'", "FAILED", str(error))
+                elif results_count is not None:
+                    self.log_test_result(f"Search - '{term}'", "PASSED", f"Found {results_count} results")
+                else:
+                    self.log_test_result(f"Search - '{term}'", "FAILED", "Could not perform search")
             
             # Test category filtering by clicking category links
             try:
-                self.driver.get("http://localhost:5000")
-                time.sleep(2)
+                home_page = EnhancedBasePage(driver)
+                home_page.goto_home()
                 
                 # Find category links
-                category_selectors = [
-                    (By.XPATH, "//a[contains(@href, 'category=')]"),
-                    (By.XPATH, "//a[contains(text(), 'Electronics')]"),
-                    (By.XPATH, "//a[contains(text(), 'Clothing')]"),
-                    (By.CSS_SELECTOR, ".category-card a"),
-                    (By.CSS_SELECTOR, ".btn[href*='category']")
-                ]
-                
                 category_clicked = False
-                for selector in category_selectors:
+                for selector in _CATEGORY_SELECTORS:
                     try:
-                        categories = self.driver.find_elements(*selector)
+                        categories = driver.find_elements(*selector)
                         if categories:
+                            old_page = home_page.current_page()
                             categories[0].click()
-                            time.sleep(2)
+                            home_page.wait_for_navigation(old_page)
                             category_clicked = True
                             break
-                    except:
+                    except (ElementClickInterceptedException, ElementNotInteractableException,
+                            StaleElementReferenceException):
                         continue
                 
                 if category_clicked:
-                    products_page = EnhancedProductsPage(self.driver)
+                    products_page = EnhancedProductsPage(driver)
                     filtered_count = products_page.get_products_count()
                     self.log_test_result("Category Filtering", "PASSED", f"Category filter shows {filtered_count} products")
                 else:
@@ -742,21 +991,22 @@ class ComprehensiveECommerceTestSuite:
                 ("Search & Filtering", self.test_search_and_filtering)
             ]
             
-            for suite_name, suite_function in test_suites:
-                print(f"\n🧪 Running Enhanced Test Suite: {suite_name}")
-                try:
-                    suite_function()
-                except Exception as e:
-                    self.log_test_result(f"{suite_name} Suite", "FAILED", str(e))
-                
-                time.sleep(2)
+            # The suites are independent: the main driver runs the first one
+            # and each of the others gets its own browser worker
+            drivers = [self.driver] + [None] * (len(test_suites) - 1)
+            suites = [suite + (driver,) for suite, driver in zip(test_suites, drivers)]
+            results = self.run_in_parallel(self.run_suite, suites, max_workers=len(suites))
+            for (suite_name, _, _), _, error in results:
+                if error is not None:
+                    self.log_test_result(f"{suite_name} Suite", "FAILED", str(error))
             
             # Generate enhanced report
             self.generate_enhanced_report()
             
-            # Keep browser open longer for review
-            print("\n⏰ Keeping browser open for 20 seconds to review results...")
-            time.sleep(20)
+            # Optionally keep the browser open for review (e.g. KEEP_OPEN_SECS=20)
+            if KEEP_OPEN_SECS:
+                print(f"\n⏰ Keeping browser open for {KEEP_OPEN_SECS} seconds to review results...")
+                time.sleep(KEEP_OPEN_SECS)
             
         except KeyboardInterrupt:
             print("\n⚠️ Tests interrupted by user")
@@ -764,53 +1014,70 @@ class ComprehensiveECommerceTestSuite:
             if self.driver:
                 self.driver.quit()
                 print("🔒 Browser closed")
+            self.http.close()
+            self._io_pool.shutdown(wait=True)
     
-    def generate_enhanced_report(self):
-        """Generate enhanced test report"""
-        print("\n" + "=" * 90)
-        print("📊 ENHANCED COMPREHENSIVE E-COMMERCE TESTING REPORT")
-        print("=" * 90)
+    def run_suite(self, suite_name, suite_function, driver=None):
+        """
+        Run one test suite on driver, or on the worker thread's own driver.
         
-        passed = len([r for r in self.test_results if r['status'] == 'PASSED'])
-        failed = len([r for r in self.test_results if r['status'] == 'FAILED'])
-        skipped = len([r for r in self.test_results if r['status'] == 'SKIPPED'])
+        The suite's output is buffered and printed in one block when it ends,
+        so concurrent suites don't interleave.
+        """
+        _suite_output.lines = [f"\n🧪 Running Enhanced Test Suite: {suite_name}"]
+        try:
+            suite_function(driver or self.worker_driver())
+        finally:
+            lines, _suite_output.lines = _suite_output.lines, None
+            with self.results_lock:
+                print("\n".join(lines))
+    
+    def generate_enhanced_report(self):
+        """Generate enhanced test report and write it out in one piece"""
+        counts = Counter(r['status'] for r in self.test_results)
+        passed, failed, skipped = counts['PASSED'], counts['FAILED'], counts['SKIPPED']
         total = len(self.test_results)
         
-        print(f"📈 ENHANCED SUMMARY:")
-        print(f"   ✅ Tests Passed: {passed}")
-        print(f"   ❌ Tests Failed: {failed}")
-        print(f"   ⏭️ Tests Skipped: {skipped}")
-        print(f"   📊 Total Tests: {total}")
-        print(f"   🎯 Success Rate: {(passed/total*100):.1f}%" if total > 0 else "   🎯 Success Rate: 0%")
-        
-        print(f"\n📋 DETAILED RESULTS:")
+        lines = [
+            "\n" + "=" * 90,
+            "📊 ENHANCED COMPREHENSIVE E-COMMERCE TESTING REPORT",
+            "=" * 90,
+            "📈 ENHANCED SUMMARY:",
+            f"   ✅ Tests Passed: {passed}",
+            f"   ❌ Tests Failed: {failed}",
+            f"   ⏭️ Tests Skipped: {skipped}",
+            f"   📊 Total Tests: {total}",
+            f"   🎯 Success Rate: {(passed/total*100):.1f}%" if total > 0 else "   🎯 Success Rate: 0%",
+            "\n📋 DETAILED RESULTS:",
+        ]
         for i, result in enumerate(self.test_results, 1):
-            status_symbol = {"PASSED": "✅", "FAILED": "❌", "SKIPPED": "⏭️"}.get(result['status'], "❓")
-            print(f"   {i:2d}. {status_symbol} {result['test']}")
+            lines.append(f"   {i:2d}. {_STATUS_SYMBOLS.get(result['status'], '❓')} {result['test']}")
             if result['details']:
-                print(f"       └─ {result['details']}")
-        
-        print(f"\n🎯 ENHANCED TESTING COVERAGE:")
-        print(f"   🔄 Complete User Workflows: Tested")
-        print(f"   🧭 Advanced Navigation: Tested")
-        print(f"   📱 Responsive Design: Tested")
-        print(f"   🔍 Search & Filtering: Tested")
-        print(f"   🛒 E-commerce Functionality: Tested")
-        print(f"   🖼️ Visual Documentation: Screenshots Captured")
+                lines.append(f"       └─ {result['details']}")
         
-        print("=" * 90)
+        lines += [
+            "\n🎯 ENHANCED TESTING COVERAGE:",
+            "   🔄 Complete User Workflows: Tested",
+            "   🧭 Advanced Navigation: Tested",
+            "   📱 Responsive Design: Tested",
+            "   🔍 Search & Filtering: Tested",
+            "   🛒 E-commerce Functionality: Tested",
+            "   🖼️ Visual Documentation: Screenshots Captured",
+            "=" * 90,
+        ]
         
         if passed >= total * 0.8:  # 80% success rate
-            print("🎉 OUTSTANDING! Your e-commerce application excels in comprehensive testing!")
-            print("The enhanced object-oriented tests validate robust functionality across all areas!")
+            lines.append("🎉 OUTSTANDING! Your e-commerce application excels in comprehensive testing!")
+            lines.append("The enhanced object-oriented tests validate robust functionality across all areas!")
         elif passed >= total * 0.6:  # 60% success rate
-            print("✅ GOOD! Your e-commerce application performs well in most test scenarios!")
-            print("Consider reviewing the failed tests for potential improvements.")
+            lines.append("✅ GOOD! Your e-commerce application performs well in most test scenarios!")
+            lines.append("Consider reviewing the failed tests for potential improvements.")
         else:
-            print("⚠️ Some areas need attention. Review the failed tests for improvement opportunities.")
+            lines.append("⚠️ Some areas need attention. Review the failed tests for improvement opportunities.")
         
-        print("=" * 90)
-
+        lines.append("=" * 90)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def main():
     """Main function to run enhanced comprehensive OOP tests"""
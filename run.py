@@ -47,8 +47,8 @@ def init_db():
         Category(name='Sports', description='Sports and fitness equipment')
     ]
     
-    for category in categories:
-        db.session.add(category)
+    # Inserted straight away in one batch; the products below refer to them by id
+    db.session.bulk_save_objects(categories)
     
     # Create admin user
     admin_email = app.config['ADMIN_EMAIL']
@@ -92,8 +92,7 @@ def init_db():
         )
     ]
     
-    for product in sample_products:
-        db.session.add(product)
+    db.session.bulk_save_objects(sample_products)
     
     db.session.commit()
     print('Database initialized with sample data!')
@@ -8,21 +8,62 @@ Usage:
     python run_tests.py --selenium          # Run only Selenium tests
     python run_tests.py --all               # Run all tests (default)
     python run_tests.py --coverage          # Run with coverage report
+    python run_tests.py --workers 1         # Run Selenium tests without xdist
+    python run_tests.py --fast              # Rerun only last run's failures (all if none failed)
 """
 
 import os
 import sys
 import argparse
+import importlib.util
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_unit_tests(verbose=False, coverage=False):
+def run_pytest(args, env=None, buffered=False):
+    """
+    Run pytest from the project root with extra environment variables.
+    
+    Buffered runs (phases running side by side) get their own interpreter and
+    print their output in one piece when they finish; otherwise pytest runs
+    in this process.
+    """
+    root = Path(__file__).parent
+    if buffered:
+        result = subprocess.run([sys.executable, "-m", "pytest", *args], cwd=root,
+                                env={**os.environ, **(env or {})}, capture_output=True, text=True)
+        print(result.stdout + result.stderr, end="")
+        return result.returncode == 0
+    
+    import pytest
+    saved_cwd, saved_env = os.getcwd(), os.environ.copy()
+    os.chdir(root)
+    os.environ.update(env or {})
+    try:
+        return pytest.main(list(args)) == 0
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+
+def cache_args(phase, fast=False):
+    """Get pytest arguments for the phase's result cache, rerunning only its last failures if fast."""
+    # Every run of a phase records into the same per-phase cache, so side-by-side
+    # phases don't overwrite each other and --fast sees the previous run's failures
+    args = ["-o", f"cache_dir=.pytest_cache/{phase}"]
+    if fast:
+        args.extend(["--lf", "--ff"])
+    return args
+
+
+def run_unit_tests(verbose=False, coverage=False, buffered=False, fast=False):
     """Run unit tests with pytest."""
     print("🧪 Running Unit Tests...")
     print("=" * 50)
     
-    cmd = ["python", "-m", "pytest", "tests/unit/", "-v"]
+    cmd = ["tests/unit/", "-v"]
     
     if coverage:
         cmd.extend(["--cov=app", "--cov-report=html", "--cov-report=term"])
@@ -30,32 +71,38 @@ def run_unit_tests(verbose=False, coverage=False):
     if verbose:
         cmd.append("-s")
     
+    cmd.extend(cache_args("unit", fast))
+    
     try:
-        result = subprocess.run(cmd, cwd=Path(__file__).parent, capture_output=False)
-        return result.returncode == 0
+        return run_pytest(cmd, buffered=buffered)
     except Exception as e:
         print(f"❌ Error running unit tests: {e}")
         return False
 
 
-def run_selenium_tests(verbose=False, headless=True):
-    """Run Selenium tests."""
+def run_selenium_tests(verbose=False, headless=True, workers=None, buffered=False, fast=False):
+    """Run Selenium tests, spread over pytest-xdist workers when it is installed."""
     print("🌐 Running Selenium Tests...")
     print("=" * 50)
     
     # Set environment variables for Selenium
-    env = os.environ.copy()
+    env = {}
     if headless:
         env['HEADLESS'] = 'true'
     
-    cmd = ["python", "-m", "pytest", "tests/selenium/", "-v", "--tb=short"]
+    cmd = ["tests/selenium/", "-v", "--tb=short"]
+    
+    # Each test class keeps its own browser, so classes are the unit of distribution
+    if workers != 1 and importlib.util.find_spec("xdist"):
+        cmd.extend(["-n", str(workers or os.cpu_count() or 4), "--dist=loadscope"])
     
     if verbose:
         cmd.append("-s")
     
+    cmd.extend(cache_args("selenium", fast))
+    
     try:
-        result = subprocess.run(cmd, cwd=Path(__file__).parent, env=env, capture_output=False)
-        return result.returncode == 0
+        return run_pytest(cmd, env=env, buffered=buffered)
     except Exception as e:
         print(f"❌ Error running Selenium tests: {e}")
         return False
@@ -109,12 +156,15 @@ def main():
     parser.add_argument('--coverage', action='store_true', help='Generate coverage report')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--headed', action='store_true', help='Run Selenium tests in headed mode')
+    parser.add_argument('--workers', type=int, help='Parallel Selenium workers (default: CPU count, 1 disables)')
+    parser.add_argument('--fast', action='store_true', help="Rerun only the last run's failures")
     
     args = parser.parse_args()
     
-    # If specific test type is chosen, turn off --all
+    # If a single test type is chosen, turn off --all; asking for both is
+    # the same as --all
     if args.unit or args.selenium:
-        args.all = False
+        args.all = args.unit and args.selenium
     
     print("🚀 E-COMMERCE APPLICATION TEST SUITE")
     print("=" * 60)
@@ -124,24 +174,34 @@ def main():
     unit_passed = True
     selenium_passed = True
     
+    if args.all:
+        # The phases share no state (the Selenium tests hit the live server), so
+        # they run side by side; each prints its output once it has finished
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            unit_future = executor.submit(run_unit_tests, args.verbose, args.coverage, True, args.fast)
+            selenium_future = executor.submit(run_selenium_tests, args.verbose, not args.headed,
+                                              args.workers, True, args.fast)
+            unit_passed = unit_future.result()
+            selenium_passed = selenium_future.result()
+        print()
+    
     # Run unit tests
-    if args.all or args.unit:
-        unit_passed = run_unit_tests(verbose=args.verbose, coverage=args.coverage)
+    elif args.unit:
+        unit_passed = run_unit_tests(verbose=args.verbose, coverage=args.coverage, fast=args.fast)
         print()
     
     # Run Selenium tests
-    if args.all or args.selenium:
-        selenium_passed = run_selenium_tests(verbose=args.verbose, headless=not args.headed)
+    elif args.selenium:
+        selenium_passed = run_selenium_tests(verbose=args.verbose, headless=not args.headed,
+                                             workers=args.workers, fast=args.fast)
         print()
     
     # Display summary
     if args.all:
         display_test_summary(unit_passed, selenium_passed)
     
-    # Exit with appropriate code
-    if (args.all and unit_passed and selenium_passed) or \
-       (args.unit and unit_passed) or \
-       (args.selenium and selenium_passed):
+    # Exit with appropriate code (a phase that did not run counts as passed)
+    if unit_passed and selenium_passed:
         sys.exit(0)
     else:
         sys.exit(1)
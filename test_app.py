@@ -4,7 +4,9 @@ Tests that the application starts and responds correctly.
 """
 
 import requests
-import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 def test_application():
     """Test that the application is running and responding correctly."""
@@ -13,12 +15,23 @@ def test_application():
     print("🔍 Testing Flask Application...")
     print("=" * 50)
     
-    # Wait a moment for the server to be ready
-    time.sleep(2)
-    
     try:
+        # The pages are independent, so fetch them all at once over one
+        # keep-alive session and report in order
+        paths = ["", "/shop/products", "/auth/login"]
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            # One pooled connection per worker; refused connections are retried
+            # with backoff while the server finishes starting
+            session.mount("http://", HTTPAdapter(
+                pool_maxsize=len(paths),
+                max_retries=Retry(connect=5, backoff_factor=0.25)
+            ))
+            home, products, login = executor.map(
+                lambda path: session.get(f"{base_url}{path}", timeout=10), paths
+            )
+        
         # Test home page
-        response = requests.get(base_url, timeout=10)
+        response = home
         if response.status_code == 200:
             print("✅ Home page (/) loads successfully")
             print(f"   Status Code: {response.status_code}")
@@ -27,14 +40,14 @@ def test_application():
             print(f"❌ Home page failed with status code: {response.status_code}")
         
         # Test shop page
-        response = requests.get(f"{base_url}/shop/products", timeout=10)
+        response = products
         if response.status_code == 200:
             print("✅ Products page (/shop/products) loads successfully")
         else:
             print(f"❌ Products page failed with status code: {response.status_code}")
         
         # Test auth pages
-        response = requests.get(f"{base_url}/auth/login", timeout=10)
+        response = login
         if response.status_code == 200:
             print("✅ Login page (/auth/login) loads successfully")
         else:
@@ -10,35 +10,36 @@ Quality Management Principles:
 """
 
 import pytest
-import tempfile
-import os
+from functools import lru_cache
+from sqlalchemy import event, insert
+from werkzeug.security import generate_password_hash
 from app import create_app, db
 from app.models import User, Product, Category, Cart, CartItem, Order, OrderItem
-from config.config import TestingConfig
+
+
+@lru_cache(maxsize=8)
+def hashed_password(password):
+    """Hash a fixture password once per session; hashing is deliberately slow."""
+    return generate_password_hash(password)
 
 
 @pytest.fixture(scope='session')
 def app():
     """Create application for testing."""
-    # Create temporary database
-    db_fd, db_path = tempfile.mkstemp()
-    
-    # Override database configuration
-    test_config = TestingConfig()
-    test_config.SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
-    test_config.WTF_CSRF_ENABLED = False
-    
+    # TestingConfig uses an in-memory database, so the schema is built once
+    # per worker process and disappears with it; there is no file to clean up
     app = create_app('testing')
-    app.config.from_object(test_config)
     
     with app.app_context():
         db.create_all()
+        
+        # Let SQLAlchemy issue BEGIN itself so SAVEPOINTs work under pysqlite;
+        # the in-memory database lives on a single pooled connection
+        with db.engine.connect() as connection:
+            connection.connection.driver_connection.isolation_level = None
+        event.listen(db.engine, 'begin', lambda conn: conn.exec_driver_sql('BEGIN'))
+        
         yield app
-        db.drop_all()
-    
-    # Clean up temporary database
-    os.close(db_fd)
-    os.unlink(db_path)
 
 
 @pytest.fixture
@@ -62,20 +63,25 @@ def auth_headers():
 # Database Fixtures
 @pytest.fixture
 def clean_db(app):
-    """Clean database before each test."""
+    """Run the test inside a transaction that is rolled back afterwards."""
     with app.app_context():
-        # Clear all tables
-        db.session.query(OrderItem).delete()
-        db.session.query(Order).delete()
-        db.session.query(CartItem).delete()
-        db.session.query(Cart).delete()
-        db.session.query(Product).delete()
-        db.session.query(Category).delete()
-        db.session.query(User).delete()
-        db.session.commit()
-        yield db
-        # Clean up after test
-        db.session.rollback()
+        engines = db.engines
+        engine = engines[None]
+        connection = engine.connect()
+        transaction = connection.begin()
+        
+        # Point the session at this connection; commits made by the test and
+        # the models only release SAVEPOINTs inside the outer transaction
+        engines[None] = connection
+        db.session.remove()
+        db.session.configure(join_transaction_mode='create_savepoint')
+        try:
+            yield db
+        finally:
+            db.session.remove()
+            transaction.rollback()
+            connection.close()
+            engines[None] = engine
 
 
 # User Fixtures
@@ -94,7 +100,7 @@ def sample_user(clean_db):
         postal_code='12345',
         country='Test Country'
     )
-    user.set_password('TestPassword123')
+    user.password_hash = hashed_password('TestPassword123')
     clean_db.session.add(user)
     clean_db.session.commit()
     return user
@@ -110,7 +116,7 @@ def admin_user(clean_db):
         last_name='User',
         is_admin=True
     )
-    admin.set_password('AdminPassword123')
+    admin.password_hash = hashed_password('AdminPassword123')
     clean_db.session.add(admin)
     clean_db.session.commit()
     return admin
@@ -137,13 +143,30 @@ def multiple_categories(clean_db):
         Category(name='Clothing', description='Fashion and apparel'),
         Category(name='Books', description='Books and educational materials'),
     ]
-    for category in categories:
-        clean_db.session.add(category)
+    clean_db.session.add_all(categories)
     clean_db.session.commit()
     return categories
 
 
 # Product Fixtures
+# Column values for multiple_products, built once; each test adds its category_id
+_PRODUCT_ROWS = tuple(
+    {
+        'name': name,
+        'slug': Product.generate_slug(name),
+        'description': description,
+        'price': price,
+        'stock_quantity': stock_quantity,
+        'is_featured': is_featured
+    }
+    for name, description, price, stock_quantity, is_featured in (
+        ('Laptop', 'High-performance laptop', 999.99, 5, True),
+        ('Mouse', 'Wireless mouse', 29.99, 20, False),
+        ('Keyboard', 'Mechanical keyboard', 149.99, 0, False),  # Out of stock
+    )
+)
+
+
 @pytest.fixture
 def sample_product(clean_db, sample_category):
     """Create a sample product for testing."""
@@ -163,32 +186,10 @@ def sample_product(clean_db, sample_category):
 @pytest.fixture
 def multiple_products(clean_db, sample_category):
     """Create multiple products for testing."""
-    products = [
-        Product(
-            name='Laptop',
-            description='High-performance laptop',
-            price=999.99,
-            category_id=sample_category.id,
-            stock_quantity=5,
-            is_featured=True
-        ),
-        Product(
-            name='Mouse',
-            description='Wireless mouse',
-            price=29.99,
-            category_id=sample_category.id,
-            stock_quantity=20
-        ),
-        Product(
-            name='Keyboard',
-            description='Mechanical keyboard',
-            price=149.99,
-            category_id=sample_category.id,
-            stock_quantity=0  # Out of stock
-        ),
-    ]
-    for product in products:
-        clean_db.session.add(product)
+    products = clean_db.session.scalars(
+        insert(Product).returning(Product, sort_by_parameter_order=True),
+        [dict(row, category_id=sample_category.id) for row in _PRODUCT_ROWS]
+    ).all()
     clean_db.session.commit()
     return products
 
@@ -223,14 +224,15 @@ def sample_cart(clean_db, sample_user):
 def cart_with_items(clean_db, sample_cart, multiple_products):
     """Create a cart with items for testing."""
     # Add items to cart
-    for i, product in enumerate(multiple_products[:2]):  # Add first 2 products
-        cart_item = CartItem(
+    clean_db.session.add_all(
+        CartItem(
             cart_id=sample_cart.id,
             product_id=product.id,
             quantity=i + 1,
             price=product.get_effective_price()
         )
-        clean_db.session.add(cart_item)
+        for i, product in enumerate(multiple_products[:2])  # Add first 2 products
+    )
     clean_db.session.commit()
     return sample_cart
 
@@ -265,14 +267,15 @@ def sample_order(clean_db, sample_user, sample_shipping_address, multiple_produc
     clean_db.session.flush()  # Get order ID
     
     # Add order items
-    for product in multiple_products[:2]:
-        order_item = OrderItem(
+    clean_db.session.add_all(
+        OrderItem(
             order_id=order.id,
             product_id=product.id,
             quantity=1,
             price=product.get_effective_price()
         )
-        clean_db.session.add(order_item)
+        for product in multiple_products[:2]
+    )
     
     # Calculate totals
     order.calculate_totals()
@@ -367,7 +370,7 @@ class UserFactory:
         defaults.update(kwargs)
         
         user = User(username=username, email=email, **defaults)
-        user.set_password('TestPassword123')
+        user.password_hash = hashed_password('TestPassword123')
         return user
 
 
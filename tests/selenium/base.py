@@ -12,6 +12,9 @@ Quality Management Principles:
 import pytest
 import os
 import time
+import atexit
+import shutil
+import tempfile
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -19,26 +22,134 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+
+# Seconds between explicit-wait checks (WebDriverWait defaults to 0.5)
+POLL_FREQUENCY = 0.1
+
+
+def explicit_wait(driver, timeout=10):
+    """Get a WebDriverWait on driver that polls every POLL_FREQUENCY seconds."""
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY)
+
+
+def worker_name():
+    """Get the pytest-xdist worker id of this process ("main" when not distributed)."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+# Chrome profile directories created by get_driver in this process
+_profile_dirs = []
+
+
+# Registered before quit_shared_driver, so at exit it runs after the browser has quit
+@atexit.register
+def remove_profile_dirs():
+    """Delete the Chrome profile directories this process created."""
+    while _profile_dirs:
+        shutil.rmtree(_profile_dirs.pop(), ignore_errors=True)
+
+
+# Images, web fonts and media the DOM assertions never look at
+_BLOCKED_ASSET_URLS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+    "*images.unsplash.com*",
+)
+
+# Scrolls an element to the middle of the viewport without smooth-scroll
+# animation, then calls back once it intersects the viewport (500 ms at most)
+_SCROLL_INTO_VIEW_JS = """
+const [element, done] = arguments;
+element.scrollIntoView({behavior: "instant", block: "center", inline: "nearest"});
+const observer = new IntersectionObserver(entries => {
+    if (entries.some(entry => entry.isIntersecting)) {
+        observer.disconnect();
+        done(true);
+    }
+});
+observer.observe(element);
+setTimeout(() => { observer.disconnect(); done(false); }, 500);
+"""
+
+
+# Resolved once per process; every test class reuses it
+_chromedriver_path = None
+
+
+def chromedriver_path():
+    """Get the ChromeDriver path, resolving it with ChromeDriverManager on first use."""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+# One browser per test process, shared by every test class
+_shared_driver = None
+
+
+def shared_driver():
+    """Get the process-wide WebDriver, starting it on first use."""
+    global _shared_driver
+    if _shared_driver is None:
+        _shared_driver = BaseSeleniumTest.get_driver()
+        # No implicit wait: it would stack on top of every explicit wait's polling
+        _shared_driver.implicitly_wait(0)
+        _shared_driver.execute_cdp_cmd("Network.enable", {})
+        block_assets(_shared_driver)
+    return _shared_driver
+
+
+def block_assets(driver, blocked=True):
+    """Block (or unblock) image, font and media downloads in driver."""
+    urls = list(_BLOCKED_ASSET_URLS) if blocked else []
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+
+
+@atexit.register
+def quit_shared_driver():
+    """Quit the process-wide WebDriver if one was started."""
+    global _shared_driver
+    if _shared_driver is not None:
+        _shared_driver.quit()
+        _shared_driver = None
+
+
+def reset_browser(driver):
+    """Return a shared browser to a fresh-looking state between test classes."""
+    driver.delete_all_cookies()
+    driver.set_window_size(1920, 1080)
+    driver.get("about:blank")
 
 
 class BaseSeleniumTest:
-    """Base class for Selenium tests with common functionality."""
+    """
+    Base class for Selenium tests with common functionality.
+    
+    All test classes share one browser; cookies, window size and the current
+    page are reset before each class, but tests must not rely on anything
+    else being fresh (cache, local storage).
+    
+    Images, fonts and media are not downloaded; classes that need them (for
+    visual checks) set BLOCK_ASSETS = False.
+    
+    The driver has no implicit wait: bare find_element calls fail at once, so
+    use the wait_for_* helpers for anything that may not be rendered yet.
+    """
+    
+    BLOCK_ASSETS = True
     
     @classmethod
     def setup_class(cls):
         """Set up WebDriver before running tests."""
-        cls.driver = cls.get_driver()
-        cls.driver.implicitly_wait(10)
-        cls.wait = WebDriverWait(cls.driver, 10)
+        cls.driver = shared_driver()
+        reset_browser(cls.driver)
+        block_assets(cls.driver, cls.BLOCK_ASSETS)
+        cls.wait = explicit_wait(cls.driver)
         cls.base_url = "http://localhost:5000"
     
-    @classmethod
-    def teardown_class(cls):
-        """Clean up WebDriver after tests."""
-        if hasattr(cls, 'driver'):
-            cls.driver.quit()
-    
     @classmethod
     def get_driver(cls):
         """Get configured WebDriver instance."""
@@ -50,6 +161,15 @@ class BaseSeleniumTest:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         
+        # Chrome locks its profile, so every browser (per xdist worker and per
+        # concurrent run) gets a fresh directory of its own
+        profile_dir = tempfile.mkdtemp(prefix=f"selenium_chrome_{worker_name()}_{os.getpid()}_")
+        _profile_dirs.append(profile_dir)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        
+        # driver.get returns at DOMContentLoaded; wait_for_page_load covers the rest
+        chrome_options.page_load_strategy = "eager"
+        
         # Run headless in CI environment
         if os.getenv('CI') or os.getenv('HEADLESS', 'false').lower() == 'true':
             chrome_options.add_argument("--headless")
@@ -62,30 +182,30 @@ class BaseSeleniumTest:
             chrome_options.binary_location = chrome_browser_path
         
         # Use ChromeDriverManager to automatically download the appropriate ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path())
         
         return webdriver.Chrome(service=service, options=chrome_options)
     
     def wait_for_element(self, locator, timeout=10):
         """Wait for element to be present and visible."""
-        return WebDriverWait(self.driver, timeout).until(
+        return explicit_wait(self.driver, timeout).until(
             EC.visibility_of_element_located(locator)
         )
     
     def wait_for_clickable(self, locator, timeout=10):
         """Wait for element to be clickable."""
-        return WebDriverWait(self.driver, timeout).until(
+        return explicit_wait(self.driver, timeout).until(
             EC.element_to_be_clickable(locator)
         )
     
     def wait_for_text_in_element(self, locator, text, timeout=10):
         """Wait for specific text to appear in element."""
-        return WebDriverWait(self.driver, timeout).until(
+        return explicit_wait(self.driver, timeout).until(
             EC.text_to_be_present_in_element(locator, text)
         )
     
     def is_element_present(self, locator):
-        """Check if element is present on the page."""
+        """Check if element is present on the page right now (no waiting)."""
         try:
             self.driver.find_element(*locator)
             return True
@@ -93,9 +213,8 @@ class BaseSeleniumTest:
             return False
     
     def scroll_to_element(self, element):
-        """Scroll to make element visible."""
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Brief pause for smooth scrolling
+        """Scroll to make element visible, returning whether it reached the viewport."""
+        return self.driver.execute_async_script(_SCROLL_INTO_VIEW_JS, element)
     
     def take_screenshot(self, name):
         """Take screenshot for debugging."""
@@ -103,7 +222,7 @@ class BaseSeleniumTest:
         if not os.path.exists(screenshot_dir):
             os.makedirs(screenshot_dir)
         
-        filename = f"{screenshot_dir}/{name}_{int(time.time())}.png"
+        filename = f"{screenshot_dir}/{name}_{worker_name()}_{int(time.time())}.png"
         self.driver.save_screenshot(filename)
         return filename
 
@@ -113,11 +232,19 @@ class BasePage:
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = explicit_wait(driver)
     
     def navigate_to(self, url):
-        """Navigate to specific URL."""
-        self.driver.get(url)
+        """
+        Navigate to specific URL.
+        
+        The navigation goes straight through the DevTools protocol, which
+        returns once the new document has committed rather than waiting for
+        it to load; call wait_for_page_load when the page must be ready.
+        """
+        result = self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
     
     def get_current_url(self):
         """Get current page URL."""
@@ -184,37 +311,14 @@ class BasePage:
         self.driver.execute_script("window.scrollTo(0, 0);")
     
     # Common navigation elements
-    @property
-    def navbar_brand(self):
-        return (By.CLASS_NAME, "navbar-brand")
-    
-    @property
-    def search_input(self):
-        return (By.NAME, "q")
-    
-    @property
-    def search_button(self):
-        return (By.CSS_SELECTOR, "button[type='submit']")
-    
-    @property
-    def cart_link(self):
-        return (By.XPATH, "//a[contains(@href, '/shop/cart')]")
-    
-    @property
-    def login_link(self):
-        return (By.XPATH, "//a[contains(@href, '/auth/login')]")
-    
-    @property
-    def register_link(self):
-        return (By.XPATH, "//a[contains(@href, '/auth/register')]")
-    
-    @property
-    def logout_link(self):
-        return (By.XPATH, "//a[contains(@href, '/auth/logout')]")
-    
-    @property
-    def flash_messages(self):
-        return (By.CLASS_NAME, "alert")
+    navbar_brand = (By.CLASS_NAME, "navbar-brand")
+    search_input = (By.NAME, "q")
+    search_button = (By.CSS_SELECTOR, "button[type='submit']")
+    cart_link = (By.CSS_SELECTOR, "a[href*='/shop/cart']")
+    login_link = (By.CSS_SELECTOR, "a[href*='/auth/login']")
+    register_link = (By.CSS_SELECTOR, "a[href*='/auth/register']")
+    logout_link = (By.CSS_SELECTOR, "a[href*='/auth/logout']")
+    flash_messages = (By.CLASS_NAME, "alert")
     
     def navigate_to_login(self):
         """Navigate to login page."""
@@ -270,13 +374,11 @@ class TestProduct:
 
 
 # Fixtures for Selenium tests
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def selenium_driver():
-    """Provide WebDriver instance for tests."""
-    driver = BaseSeleniumTest.get_driver()
-    driver.implicitly_wait(10)
-    yield driver
-    driver.quit()
+    """Provide the shared WebDriver instance for tests."""
+    yield shared_driver()
+    quit_shared_driver()
 
 
 @pytest.fixture
@@ -312,14 +414,14 @@ def test_product():
 # Utility functions for Selenium tests
 def wait_for_page_load(driver, timeout=10):
     """Wait for page to fully load."""
-    WebDriverWait(driver, timeout).until(
+    explicit_wait(driver, timeout).until(
         lambda d: d.execute_script("return document.readyState") == "complete"
     )
 
 
 def safe_click(driver, locator, timeout=10):
     """Safely click element with explicit wait."""
-    element = WebDriverWait(driver, timeout).until(
+    element = explicit_wait(driver, timeout).until(
         EC.element_to_be_clickable(locator)
     )
     element.click()
@@ -327,7 +429,7 @@ def safe_click(driver, locator, timeout=10):
 
 def safe_send_keys(driver, locator, text, timeout=10):
     """Safely send keys to element with explicit wait."""
-    element = WebDriverWait(driver, timeout).until(
+    element = explicit_wait(driver, timeout).until(
         EC.visibility_of_element_located(locator)
     )
     element.clear()
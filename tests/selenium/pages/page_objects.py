@@ -83,7 +83,7 @@ class LoginPage(BasePage):
     USERNAME_FIELD = (By.ID, "username")
     PASSWORD_FIELD = (By.ID, "password")
     LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
-    REGISTER_LINK = (By.XPATH, "//a[contains(@href, '/auth/register')]")
+    REGISTER_LINK = (By.CSS_SELECTOR, "a[href*='/auth/register']")
     ERROR_MESSAGES = (By.CLASS_NAME, "alert-danger")
     FORGOT_PASSWORD_LINK = (By.XPATH, "//a[contains(text(), 'Forgot Password')]")
     LOGIN_FORM = (By.CSS_SELECTOR, "form")
@@ -148,7 +148,7 @@ class RegisterPage(BasePage):
     PASSWORD_FIELD = (By.ID, "password")
     CONFIRM_PASSWORD_FIELD = (By.ID, "confirm_password")
     REGISTER_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
-    LOGIN_LINK = (By.XPATH, "//a[contains(@href, '/auth/login')]")
+    LOGIN_LINK = (By.CSS_SELECTOR, "a[href*='/auth/login']")
     ERROR_MESSAGES = (By.CLASS_NAME, "alert-danger")
     SUCCESS_MESSAGES = (By.CLASS_NAME, "alert-success")
     REGISTER_FORM = (By.CSS_SELECTOR, "form")
@@ -533,7 +533,7 @@ class CheckoutPage(BasePage):
     FILL_DEMO_DATA_BUTTON = (By.XPATH, "//button[contains(text(), 'Fill Demo Data')]")
     ORDER_SUMMARY = (By.CLASS_NAME, "order-summary")
     CHECKOUT_FORM = (By.CSS_SELECTOR, "form")
-    BACK_TO_CART_LINK = (By.XPATH, "//a[contains(@href, '/shop/cart')]")
+    BACK_TO_CART_LINK = (By.CSS_SELECTOR, "a[href*='/shop/cart']")
     ERROR_MESSAGES = (By.CLASS_NAME, "alert-danger")
     SUCCESS_MESSAGES = (By.CLASS_NAME, "alert-success")
     
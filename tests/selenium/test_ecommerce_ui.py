@@ -19,10 +19,9 @@ Quality Management Principles:
 import pytest
 import time
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from tests.selenium.base import BaseSeleniumTest
+from tests.selenium.base import BaseSeleniumTest, explicit_wait
 from tests.selenium.pages.page_objects import (
     HomePage, LoginPage, RegisterPage, ProductListPage,
     ProductDetailPage, CartPage, CheckoutPage, OrderConfirmationPage
@@ -451,7 +450,7 @@ class TestDataIntegration(BaseSeleniumTest):
         """Wait for URL to change."""
         original_url = self.driver.current_url
         try:
-            WebDriverWait(self.driver, timeout).until(
+            explicit_wait(self.driver, timeout).until(
                 lambda driver: driver.current_url != original_url
             )
         except TimeoutException:
@@ -459,6 +458,6 @@ class TestDataIntegration(BaseSeleniumTest):
     
     def _wait_for_page_load(self, timeout=10):
         """Wait for page to fully load."""
-        WebDriverWait(self.driver, timeout).until(
+        explicit_wait(self.driver, timeout).until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"
         )
\ No newline at end of file
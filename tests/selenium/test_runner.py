@@ -176,9 +176,9 @@ def main():
     if args.stop_on_failure:
         test_args.append("-x")
     
-    # Parallel execution
+    # Parallel execution; each worker keeps one browser for whole test classes
     if args.parallel:
-        test_args.extend(["-n", str(args.parallel)])
+        test_args.extend(["-n", str(args.parallel), "--dist=loadscope"])
     
     # Coverage
     if args.coverage:
@@ -184,6 +184,17 @@ class TestProductModel:
             assert product.is_featured is True
             assert product.is_active is True
     
+    def test_featured_and_latest_products(self, clean_db, multiple_products):
+        """Test combined featured and latest products retrieval."""
+        featured, latest = Product.get_featured_and_latest(limit=8)
+        
+        assert {p.id for p in featured} == {p.id for p in multiple_products if p.is_featured}
+        assert {p.id for p in latest} == {p.id for p in multiple_products}
+        
+        # Latest products should be ordered newest first
+        created = [p.created_at for p in latest]
+        assert created == sorted(created, reverse=True)
+    
     def test_products_by_category(self, clean_db, sample_category, multiple_products):
         """Test products by category retrieval."""
         results = Product.get_products_by_category(sample_category.id)
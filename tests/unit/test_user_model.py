@@ -118,6 +118,18 @@ class TestUserModel:
                 last_name='User'
             )
     
+    def test_create_user_rejects_unknown_fields(self, clean_db):
+        """Test that create_user only accepts User columns as extra fields."""
+        with pytest.raises(TypeError, match="Unknown user fields: nickname"):
+            User.create_user(
+                username='newuser',
+                email='new@example.com',
+                password='NewPassword123',
+                first_name='New',
+                last_name='User',
+                nickname='Newbie'
+            )
+    
     def test_user_profile_completion(self, clean_db):
         """Test profile completion checking."""
         # User without complete profile